@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import json
+import hashlib
 import os
 from pathlib import Path
 from typing import Optional
 
+from . import jsonio
 from .project import ProjectConfig
 
 
@@ -30,23 +31,45 @@ def resolve_autosave_path(project_root: Optional[str] = None) -> str:
     return str(base / "autosave.json")
 
 
-def atomic_write_text(path: str, text: str, encoding: str = "utf-8") -> None:
+def atomic_write_bytes(path: str, data: bytes) -> None:
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
     tmp = p.with_suffix(p.suffix + ".tmp")
-    tmp.write_text(text, encoding=encoding)
+    tmp.write_bytes(data)
     os.replace(str(tmp), str(p))
 
 
+def atomic_write_text(path: str, text: str, encoding: str = "utf-8") -> None:
+    atomic_write_bytes(path, text.encode(encoding))
+
+
 def atomic_write_json(path: str, data) -> None:
-    payload = json.dumps(data, indent=2)
-    atomic_write_text(path, payload)
+    atomic_write_bytes(path, jsonio.dumps(data, indent=True))
 
 
 def save_project_atomic(project: ProjectConfig, path: str) -> None:
     atomic_write_json(path, project.to_dict())
 
 
+def save_project_if_changed(
+    project: ProjectConfig, path: str, last_digest: Optional[bytes]
+) -> bytes:
+    """Atomically save project unless an identical payload is already on disk.
+
+    last_digest is the value returned by the previous call for this app (None
+    at first). The digest covers the target path and the serialized project,
+    so an unchanged project is not rewritten on every dirty tick; a missing
+    file is always written. Returns the digest to pass in next time.
+    """
+    payload = jsonio.dumps(project.to_dict(), indent=True)
+    h = hashlib.blake2b(path.encode("utf-8"), digest_size=16)
+    h.update(payload)
+    digest = h.digest()
+    if digest != last_digest or not os.path.exists(path):
+        atomic_write_bytes(path, payload)
+    return digest
+
+
 def load_project_if_exists(path: str) -> Optional[ProjectConfig]:
     p = Path(path)
     if not p.exists():
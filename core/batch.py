@@ -4,6 +4,7 @@ core/batch.py — Batch (run_all) execution coordinator.
 Responsible for:
   - Iterating RunItems in tree order
   - Maintaining a shared in-memory workbook cache per destination file
+    targeted by more than one item
   - Saving each destination after every successful write (crash safety)
   - Fail-fast on first error
   - Emitting optional progress callbacks
@@ -13,6 +14,7 @@ to core.runner.run_sheet.
 """
 from __future__ import annotations
 
+from collections import Counter
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from openpyxl import Workbook
@@ -38,10 +40,16 @@ def run_all(
 
     Each workbook is saved to disk after every successful item for crash safety.
     Fail-fast on first error: remaining items are not executed.
+
+    A destination file targeted by exactly one item has no later writes to
+    share, so that item runs standalone (no cache): a new file is streamed
+    out through a write-only workbook instead of an in-memory cell grid.
     """
+    items = list(items)
     results: List[SheetResult] = []
     ok = True
     wb_cache: Dict[str, Workbook] = {}
+    dest_uses = Counter(cfg.destination.file_path for _, _, cfg in items)
 
     def _emit(event: str, payload: Any) -> None:
         if on_progress is not None:
@@ -57,8 +65,10 @@ def run_all(
             "sheet_name": sheet_cfg.name,
         })
 
+        dest_path = sheet_cfg.destination.file_path
+        cache = None if dest_path and dest_uses[dest_path] == 1 else wb_cache
         try:
-            result = run_sheet(source_path, sheet_cfg, recipe_name, _wb_cache=wb_cache)
+            result = run_sheet(source_path, sheet_cfg, recipe_name, _wb_cache=cache)
         except AppError as e:
             result = SheetResult(
                 source_path=source_path,
@@ -85,7 +95,7 @@ def run_all(
             break
 
         # Successful write: persist to disk so file reflects current state.
-        dest_path = sheet_cfg.destination.file_path
+        # (Standalone items have already saved their own file.)
         if dest_path and dest_path in wb_cache:
             try:
                 wb_cache[dest_path].save(dest_path)
@@ -56,14 +56,28 @@ def load_csv(path: str) -> List[List[Any]]:
 
 
 def load_xlsx(path: str, sheet_name: str) -> List[List[Any]]:
-    wb = load_workbook(path, data_only=True)
-    if sheet_name not in wb.sheetnames:
-        raise ValueError(f"Sheet not found: {sheet_name}")
-    ws = wb[sheet_name]
-
-    rows = []
-    for row in ws.iter_rows(values_only=True):
-        rows.append(list(row))
-
+    """
+    Read one sheet's values. The workbook is opened read-only, so rows are
+    streamed from the sheet XML without building Cell objects; the stored
+    <dimension> is ignored (reset_dimensions) because some writers leave it
+    stale, which would clip the streamed rows.
+
+    Trailing <row> elements with no cells at all (left by cleared cells or
+    custom row heights) stream as empty tuples and are dropped: a normal
+    load_workbook() sheet never counts them. Rows holding empty-valued cells
+    are kept, as they always were.
+    """
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        if sheet_name not in wb.sheetnames:
+            raise ValueError(f"Sheet not found: {sheet_name}")
+        ws = wb[sheet_name]
+        ws.reset_dimensions()
+        rows = [list(row) for row in ws.iter_rows(values_only=True)]
+    finally:
+        wb.close()
+
+    while rows and not rows[-1]:
+        rows.pop()
     rows = normalize_table(rows)
     return rows
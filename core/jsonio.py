@@ -0,0 +1,34 @@
+"""
+core/jsonio.py — JSON encode/decode for project, autosave and template files.
+
+Uses orjson when it is installed (C encoder/decoder that produces UTF-8 bytes
+directly) and falls back to the stdlib json module otherwise. Both paths emit
+equivalent documents, so files written by one load with the other.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional accelerator
+    orjson = None
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Encode obj as UTF-8 JSON bytes; compact unless indent (2 spaces)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        text = json.dumps(obj, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON from bytes or str. Malformed input raises ValueError."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
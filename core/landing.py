@@ -21,10 +21,13 @@ Design principles:
 Public API:
   find_target_col_offsets(shaped)                   -> List[int]  (0-based offsets)
   read_zone(ws, col_start, col_end, extra_rows)     -> CellMap
+  read_cells(ws, row_start, row_end, cols)          -> CellMap  (in-memory sheets)
   scan_target_cols(cell_map, target_abs_cols)       -> int  (max occupied row)
   probe_target_cols(cell_map, row_start, row_end,
                     target_abs_cols)                -> (row,col,value)|None
   is_dest_cell_occupied(value)                      -> bool
+  column_max_rows(ws)                               -> {col: max occupied row} | None
+  note_rows_written(ws, start_row, start_col, shaped)
 """
 from __future__ import annotations
 
@@ -94,8 +97,10 @@ def read_zone(
     """
     Read cells in col_start..col_end from the worksheet using iter_rows().
 
-    iter_rows() is a safe read-only iterator that does NOT register phantom
-    Cell objects, so ws.max_row is never inflated by this call.
+    Used for sheets without an in-memory cell store (read-only sheets), whose
+    iter_rows() streams cells without registering them. On a regular sheet
+    iter_rows() creates a Cell per visited position; build_plan uses
+    read_cells() there instead.
 
     Only cells with non-None values are included in the returned map.
     extra_rows: extend the read beyond ws.max_row to cover the probe zone.
@@ -120,6 +125,93 @@ def read_zone(
     return cell_map
 
 
+def read_cells(
+    ws: Worksheet,
+    row_start: int,
+    row_end: int,
+    cols: List[int],
+) -> CellMap:
+    """
+    Sparse snapshot of rows row_start..row_end x cols from an in-memory
+    worksheet's cell store: one dict lookup per position, independent of how
+    many rows the sheet holds above the zone.
+
+    Unlike iter_rows() on a regular worksheet, which creates a Cell for every
+    position it visits, this never registers cells. Only valid when
+    column_max_rows(ws) is not None (the sheet has a cell store).
+    """
+    cells = ws._cells
+    cell_map: CellMap = {}
+    for r in range(row_start, row_end + 1):
+        for c in cols:
+            cell = cells.get((r, c))
+            if cell is not None and cell.value is not None:
+                cell_map[(r, c)] = cell.value
+    return cell_map
+
+
+# ── Per-column occupancy cache ────────────────────────────────────────────────
+
+_COL_MAX_ATTR = "_tx_col_max"
+
+
+def column_max_rows(ws: Worksheet) -> Optional[Dict[int, int]]:
+    """
+    Return {col: highest occupied row} for the whole worksheet.
+
+    Built in one pass over the worksheet's cell store (no iter_rows, so no
+    cells are materialised) and cached on the worksheet, so an append scan
+    reduces to one dict lookup per target column. The cache is stamped with
+    the cell count and rebuilt whenever cells are added behind its back;
+    apply_write_plan keeps it current via note_rows_written().
+
+    Returns None for worksheets without an in-memory cell store (read-only
+    sheets); callers fall back to read_zone().
+    """
+    cells = getattr(ws, "_cells", None)
+    if cells is None:
+        return None
+    cached = ws.__dict__.get(_COL_MAX_ATTR)
+    if cached is not None and cached[0] == len(cells):
+        return cached[1]
+
+    col_max = _scan_column_max(cells)
+    setattr(ws, _COL_MAX_ATTR, (len(cells), col_max))
+    return col_max
+
+
+def _scan_column_max(cells: Dict[Tuple[int, int], Any]) -> Dict[int, int]:
+    col_max: Dict[int, int] = {}
+    for (r, c), cell in cells.items():
+        if r > col_max.get(c, 0) and is_dest_cell_occupied(cell.value):
+            col_max[c] = r
+    return col_max
+
+
+def note_rows_written(
+    ws: Worksheet,
+    start_row: int,
+    start_col: int,
+    shaped: List[List[Any]],
+) -> None:
+    """
+    Fold a just-written shaped block into the cached column-max map, if one
+    exists, and re-stamp it against the worksheet's new cell count.
+    """
+    cached = ws.__dict__.get(_COL_MAX_ATTR)
+    if cached is None:
+        return
+    col_max = cached[1]
+    for offset in find_target_col_offsets(shaped):
+        for r in range(len(shaped) - 1, -1, -1):
+            row = shaped[r]
+            if offset < len(row) and is_dest_cell_occupied(row[offset]):
+                c = start_col + offset
+                col_max[c] = max(col_max.get(c, 0), start_row + r)
+                break
+    setattr(ws, _COL_MAX_ATTR, (len(ws._cells), col_max))
+
+
 # ── Scan (target columns only) ────────────────────────────────────────────────
 
 def scan_target_cols(
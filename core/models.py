@@ -7,7 +7,7 @@ from typing import List, Optional, Literal, Dict, Any
 
 # ---- Core project tree model ----
 
-@dataclass
+@dataclass(slots=True)
 class Destination:
     """
     Destination placement for a shaped output table.
@@ -19,7 +19,7 @@ class Destination:
     start_row: str = ""           # explicit numeric string, or "" for append mode
 
 
-@dataclass
+@dataclass(slots=True)
 class Rule:
     """
     Rules filter rows after row selection and before column selection/paste shaping.
@@ -68,7 +68,7 @@ class ProjectConfig:
 
 # ---- Run reporting ----
 
-@dataclass
+@dataclass(slots=True)
 class SheetResult:
     source_path: str
     recipe_name: str
@@ -82,7 +82,7 @@ class SheetResult:
     error_details: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RunReport:
     """
     Returned by engine.run_sheet/run_all. GUI renders this; tests can assert it.
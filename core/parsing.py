@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 import re
-from typing import List
+from functools import lru_cache
+from itertools import product
+from string import ascii_uppercase
+from typing import List, Tuple
 
 from .errors import AppError, BAD_SPEC
 
@@ -11,12 +14,40 @@ _COL_RE = re.compile(r"^[A-Z]+$")
 _COL_TOKEN_RE = re.compile(r"^\s*([A-Z]+)\s*(?:-\s*([A-Z]+)\s*)?$")
 _ROW_TOKEN_RE = re.compile(r"^\s*(\d+)\s*(?:-\s*(\d+)\s*)?$")
 
+# Whole-spec forms of the token grammar: a spec that fullmatches its _SPEC_RE
+# is split into (start, end) pairs by one findall in the C regex engine; only
+# an invalid spec falls back to the per-token loop to name the bad token.
+_COL_ITEM = r"\s*(?:[A-Z]+\s*(?:-\s*[A-Z]+\s*)?)?"
+_ROW_ITEM = r"\s*(?:\d+\s*(?:-\s*\d+\s*)?)?"
+_COL_SPEC_RE = re.compile(rf"{_COL_ITEM}(?:,{_COL_ITEM})*")
+_ROW_SPEC_RE = re.compile(rf"{_ROW_ITEM}(?:,{_ROW_ITEM})*")
+_COL_PAIR_RE = re.compile(r"([A-Z]+)\s*(?:-\s*([A-Z]+))?")
+_ROW_PAIR_RE = re.compile(r"(\d+)\s*(?:-\s*(\d+))?")
+
+
+def _bad_token(token_re: "re.Pattern[str]", s: str, what: str) -> AppError:
+    for part in s.split(","):
+        if part.strip() != "" and not token_re.match(part):
+            return AppError(BAD_SPEC, f"Bad {what} token: {part!r}")
+    return AppError(BAD_SPEC, f"Bad {what} spec: {s!r}")
+
+# Column letters for every index in 1..18278 (A..ZZZ, a superset of Excel's
+# XFD limit), built once at import; _LETTERS[n] is the letters for index n.
+_LETTERS = (None,) + tuple(
+    "".join(p) for width in (1, 2, 3) for p in product(ascii_uppercase, repeat=width)
+)
+_INDEX = {letters: n for n, letters in enumerate(_LETTERS) if letters}
+
 
 def col_letters_to_index(col: str) -> int:
     """
     Convert Excel column letters to 1-based index (A->1, Z->26, AA->27).
+    A..ZZZ come straight from the import-time table.
     """
     s = (col or "").strip().upper()
+    n = _INDEX.get(s)
+    if n is not None:
+        return n
     if not s or not _COL_RE.match(s):
         raise AppError(BAD_SPEC, f"Bad column: {col!r}")
     n = 0
@@ -28,7 +59,10 @@ def col_letters_to_index(col: str) -> int:
 def col_index_to_letters(n: int) -> str:
     """
     Convert 1-based index to Excel column letters (1->A).
+    1..18278 come straight from the import-time table.
     """
+    if 0 < n < len(_LETTERS):
+        return _LETTERS[n]
     if n <= 0:
         raise AppError(BAD_SPEC, f"Bad column index: {n}")
     out = []
@@ -39,31 +73,49 @@ def col_index_to_letters(n: int) -> str:
     return "".join(reversed(out))
 
 
+def _spans_to_indices(spans: List[Tuple[int, int]]) -> Tuple[int, ...]:
+    """
+    Sorted, de-duplicated indices covered by inclusive (lo, hi) spans.
+    Overlapping/adjacent spans are merged first, so each index is emitted
+    exactly once in order — no per-index hashing or final sort.
+    """
+    spans.sort()
+    out: List[int] = []
+    nxt = 0                     # first index not yet emitted
+    for lo, hi in spans:
+        if hi < nxt:
+            continue
+        out.extend(range(max(lo, nxt), hi + 1))
+        nxt = hi + 1
+    return tuple(out)
+
+
 def parse_columns(spec: str) -> List[int]:
     """
     Parse a column spec like: 'A,C,AC-ZZ' into 0-based indices.
     Blank spec => [] (caller interprets as ALL).
     """
-    s = (spec or "").strip().upper()
+    return list(_parse_columns_cached(spec or ""))
+
+
+@lru_cache(maxsize=256)
+def _parse_columns_cached(spec: str) -> Tuple[int, ...]:
+    # Specs repeat across every run of a recipe; cache as an immutable tuple
+    # so callers always get their own list back from parse_columns.
+    s = spec.strip().upper()
     if s == "":
-        return []
-
-    items = []
-    for part in [p for p in s.split(",") if p.strip() != ""]:
-        m = _COL_TOKEN_RE.match(part)
-        if not m:
-            raise AppError(BAD_SPEC, f"Bad column token: {part!r}")
-        a, b = m.group(1), m.group(2)
+        return ()
+
+    if not _COL_SPEC_RE.fullmatch(s):
+        raise _bad_token(_COL_TOKEN_RE, s, "column")
+
+    spans = []
+    for a, b in _COL_PAIR_RE.findall(s):
         ia = col_letters_to_index(a) - 1
-        if b is None:
-            items.append(ia)
-        else:
-            ib = col_letters_to_index(b) - 1
-            lo, hi = (ia, ib) if ia <= ib else (ib, ia)
-            items.extend(range(lo, hi + 1))
+        ib = col_letters_to_index(b) - 1 if b else ia
+        spans.append((ia, ib) if ia <= ib else (ib, ia))
 
-    # unique + sorted
-    return sorted(set(items))
+    return _spans_to_indices(spans)
 
 
 def parse_rows(spec: str) -> List[int]:
@@ -71,26 +123,25 @@ def parse_rows(spec: str) -> List[int]:
     Parse a row spec like: '1,1-3,9-80' into 0-based indices.
     Blank spec => [] (caller interprets as ALL).
     """
-    s = (spec or "").strip()
+    return list(_parse_rows_cached(spec or ""))
+
+
+@lru_cache(maxsize=256)
+def _parse_rows_cached(spec: str) -> Tuple[int, ...]:
+    s = spec.strip()
     if s == "":
-        return []
-
-    items = []
-    for part in [p for p in s.split(",") if p.strip() != ""]:
-        m = _ROW_TOKEN_RE.match(part)
-        if not m:
-            raise AppError(BAD_SPEC, f"Bad row token: {part!r}")
-        a = int(m.group(1))
-        b = int(m.group(2)) if m.group(2) is not None else None
-        if a <= 0 or (b is not None and b <= 0):
-            raise AppError(BAD_SPEC, f"Row numbers must be >= 1: {part!r}")
+        return ()
 
-        ia = a - 1
-        if b is None:
-            items.append(ia)
-        else:
-            ib = b - 1
-            lo, hi = (ia, ib) if ia <= ib else (ib, ia)
-            items.extend(range(lo, hi + 1))
+    if not _ROW_SPEC_RE.fullmatch(s):
+        raise _bad_token(_ROW_TOKEN_RE, s, "row")
+
+    spans = []
+    for ta, tb in _ROW_PAIR_RE.findall(s):
+        a = int(ta)
+        b = int(tb) if tb else a
+        if a <= 0 or b <= 0:
+            part = f"{ta}-{tb}" if tb else ta
+            raise AppError(BAD_SPEC, f"Row numbers must be >= 1: {part!r}")
+        spans.append((a - 1, b - 1) if a <= b else (b - 1, a - 1))
 
-    return sorted(set(items))
+    return _spans_to_indices(spans)
@@ -18,8 +18,10 @@ from openpyxl.worksheet.worksheet import Worksheet
 
 from .errors import AppError, DEST_BLOCKED, BAD_SPEC
 from .landing import (
+    column_max_rows,
     is_dest_cell_occupied,
     find_target_col_offsets,
+    read_cells,
     read_zone,
     scan_target_cols,
     probe_target_cols,
@@ -87,10 +89,18 @@ def build_plan(
     t_col_min = min(target_abs_cols)
     t_col_max = max(target_abs_cols)
 
+    col_max = column_max_rows(ws)
+    used_in_targets = 0
+    if col_max is not None:
+        used_in_targets = max(col_max.get(c, 0) for c in target_abs_cols)
+
     if append_mode:
         # Scan only target columns to find the highest occupied row.
-        scan_map = read_zone(ws, t_col_min, t_col_max, extra_rows=0)
-        max_used = scan_target_cols(scan_map, target_abs_cols)
+        if col_max is not None:
+            max_used = used_in_targets
+        else:
+            scan_map = read_zone(ws, t_col_min, t_col_max, extra_rows=0)
+            max_used = scan_target_cols(scan_map, target_abs_cols)
         start_row = max_used + 1 if max_used > 0 else 1
     else:
         try:
@@ -102,11 +112,19 @@ def build_plan(
 
     row_end = start_row + height - 1
 
-    # Probe target columns in the landing rectangle.
-    extra = max(0, row_end - (ws.max_row or 0))
-    probe_map = read_zone(ws, t_col_min, t_col_max, extra_rows=extra)
-
-    blocker = probe_target_cols(probe_map, start_row, row_end, target_abs_cols)
+    # Probe target columns in the landing rectangle. With the column-max map,
+    # a landing zone entirely below every target column's last used row is
+    # clear by construction (always the case in append mode); only a possible
+    # overlap needs the cell-level probe to locate the first blocker.
+    if col_max is not None and start_row > used_in_targets:
+        blocker = None
+    else:
+        if col_max is not None:
+            probe_map = read_cells(ws, start_row, row_end, target_abs_cols)
+        else:
+            extra = max(0, row_end - (ws.max_row or 0))
+            probe_map = read_zone(ws, t_col_min, t_col_max, extra_rows=extra)
+        blocker = probe_target_cols(probe_map, start_row, row_end, target_abs_cols)
     if blocker is not None:
         b_row, b_col, b_val = blocker
         raise AppError(
@@ -1,13 +1,33 @@
 \
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict, field
-from typing import List, Dict, Any
-import json
+from dataclasses import dataclass, field, fields
+from typing import List, Dict, Any, Union
+import os
 
+from . import jsonio
 from .models import SheetConfig, Destination, Rule
 
 
+# Rule and Destination are slotted (no __dict__), so read them by field name.
+_RULE_FIELDS = tuple(f.name for f in fields(Rule))
+_DEST_FIELDS = tuple(f.name for f in fields(Destination))
+
+
+def sheet_to_dict(sh: SheetConfig) -> Dict[str, Any]:
+    """
+    SheetConfig as a plain JSON-ready dict (same shape as dataclasses.asdict).
+
+    Flat copy instead of asdict: every leaf is a str, so the recursive
+    deepcopy asdict performs buys nothing on this tree.
+    """
+    d = dict(vars(sh))
+    d["rules"] = [{k: getattr(r, k) for k in _RULE_FIELDS} for r in sh.rules]
+    dest = sh.destination
+    d["destination"] = {k: getattr(dest, k) for k in _DEST_FIELDS}
+    return d
+
+
 @dataclass
 class RecipeConfig:
     name: str
@@ -27,7 +47,18 @@ class ProjectConfig:
     # ---------- Serialization ----------
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "sources": [
+                {
+                    "path": s.path,
+                    "recipes": [
+                        {"name": r.name, "sheets": [sheet_to_dict(sh) for sh in r.sheets]}
+                        for r in s.recipes
+                    ],
+                }
+                for s in self.sources
+            ]
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ProjectConfig":
@@ -62,14 +93,25 @@ class ProjectConfig:
 
     # ---------- File IO ----------
 
-    def save_json(self, path: str) -> None:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2)
+    def save_json(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        """Write compact JSON via a temp file + os.replace (never half-written)."""
+        payload = jsonio.dumps(self.to_dict())
+        tmp = os.fspath(path) + ".tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
 
     @classmethod
     def load_json(cls, path: str) -> "ProjectConfig":
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = jsonio.loads(f.read())
         return cls.from_dict(data)
 
     # ---------- Execution Flattening ----------
@@ -79,9 +121,9 @@ class ProjectConfig:
         Returns list of (source_path, recipe_name, sheet_cfg)
         in tree order.
         """
-        items = []
-        for source in self.sources:
-            for recipe in source.recipes:
-                for sheet in recipe.sheets:
-                    items.append((source.path, recipe.name, sheet))
-        return items
+        return [
+            (source.path, recipe.name, sheet)
+            for source in self.sources
+            for recipe in source.recipes
+            for sheet in recipe.sheets
+        ]
@@ -19,16 +19,41 @@ Include / Exclude:
 AND / OR (combine_mode):
   AND       — all rule results must be True for the row to be kept.
   OR        — any rule result being True is enough.
+
+Large tables whose rules include < / > or read the same column twice are
+filtered column-wise with numpy (when installed): each referenced column is
+converted once — to a float vector, or to lower-cased text — and shared by
+every rule on it. Results are identical to the row path.
 """
 from __future__ import annotations
 
-from typing import Any, List
+import operator
+from functools import lru_cache
+from typing import Any, Callable, List, Tuple
 
 from .errors import AppError, INVALID_RULE
 from .models import Rule
 from .parsing import col_letters_to_index
 
 
+_NAN = float("nan")
+
+# Below this many rows the compiled per-row predicate is already cheap, and
+# building column vectors (and importing numpy) does not pay for itself.
+_VECTOR_MIN_ROWS = 4096
+
+# Distinct string cells whose contains / equals result each compiled rule
+# remembers during one apply_rules call; bounded so a huge column of unique
+# strings cannot grow it. apply_rules empties the memos when it returns, so
+# cell data never outlives the run even though the predicates are cached.
+_TEXT_CACHE_SIZE = 4096
+
+# Multi-rule tables at least this long have their rules reordered by the pass
+# rate measured on the first _SELECTIVITY_SAMPLE rows (see _by_selectivity).
+_REORDER_MIN_ROWS = 256
+_SELECTIVITY_SAMPLE = 64
+
+
 def _safe_numeric(value: Any):
     """Return float(value) or None if conversion fails."""
     try:
@@ -37,42 +62,232 @@ def _safe_numeric(value: Any):
         return None
 
 
-def _evaluate(cell_value: Any, rule: Rule) -> bool:
+def _float_or_nan(value: Any) -> float:
+    """float(value), or NaN (which compares False both ways) if it fails."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return _NAN
+
+
+def _numpy_or_none():
+    """Return numpy, imported on first use, or None if it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _no_memo() -> None:
+    pass
+
+
+def _compile_match(rule: Rule) -> Callable[[Any], bool]:
+    """
+    Resolve the rule's operator once into a cell -> bool matcher.
+
+    Everything that depends only on the rule (lower-cased target, numeric
+    target, comparison direction) is computed here, so the per-cell path does
+    no operator-name dispatch and no repeated target normalisation. Text
+    operators also memoise their result per distinct string cell (spreadsheet
+    columns repeat values), so a repeated string is normalised only once;
+    match.cache_clear() empties that memo (a no-op for numeric operators).
+    """
     op     = rule.operator
     target = rule.value
 
     # ── contains ──────────────────────────────────────────────────────────────
     if op == "contains":
-        if cell_value is None:
-            return False
-        return target.lower() in str(cell_value).lower()
+        needle = target.lower()
+
+        @lru_cache(maxsize=_TEXT_CACHE_SIZE)
+        def text_match(text: str) -> bool:
+            return needle in text.lower()
+
+        def match(cell_value: Any) -> bool:
+            if type(cell_value) is str:
+                return text_match(cell_value)
+            if cell_value is None:
+                return False
+            return needle in str(cell_value).lower()
+
+        match.cache_clear = text_match.cache_clear
+        return match
 
     # ── equals ────────────────────────────────────────────────────────────────
     if op == "equals":
         # None cell: only matches if target is also empty
-        if cell_value is None:
-            return target.strip() == ""
+        none_matches = target.strip() == ""
+        right_n      = _safe_numeric(target)
+        right_s      = target.strip().lower()
+
+        def value_match(cell_value: Any) -> bool:
+            # Try numeric comparison first (avoids "2" != "2.0" mismatches)
+            if right_n is not None:
+                left_n = _safe_numeric(cell_value)
+                if left_n is not None:
+                    return left_n == right_n
+            # Fall back to case-insensitive string comparison
+            return str(cell_value).strip().lower() == right_s
 
-        # Try numeric comparison first (avoids "2" != "2.0" mismatches)
-        left_n  = _safe_numeric(cell_value)
-        right_n = _safe_numeric(target)
-        if left_n is not None and right_n is not None:
-            return left_n == right_n
+        text_match = lru_cache(maxsize=_TEXT_CACHE_SIZE)(value_match)
 
-        # Fall back to case-insensitive string comparison
-        return str(cell_value).strip().lower() == target.strip().lower()
+        def match(cell_value: Any) -> bool:
+            if type(cell_value) is str:
+                return text_match(cell_value)
+            if cell_value is None:
+                return none_matches
+            return value_match(cell_value)
+
+        match.cache_clear = text_match.cache_clear
+        return match
 
     # ── < / > ─────────────────────────────────────────────────────────────────
     if op in ("<", ">"):
-        left  = _safe_numeric(cell_value)
         right = _safe_numeric(target)
-        if left is None or right is None:
-            return False
-        return left < right if op == "<" else left > right
+        if right is None:
+            def match(cell_value: Any) -> bool:
+                return False
+        else:
+            compare = operator.lt if op == "<" else operator.gt
+
+            def match(cell_value: Any) -> bool:
+                left = _safe_numeric(cell_value)
+                return left is not None and compare(left, right)
+
+        match.cache_clear = _no_memo
+        return match
 
     raise AppError(INVALID_RULE, f"Unknown operator: {op!r}")
 
 
+def _compile_rule(rule: Rule) -> Callable[[List[Any]], bool]:
+    """
+    Compile a rule into a row predicate with its column index and
+    include/exclude inversion bound. Raises AppError(INVALID_RULE) for an
+    unknown operator or mode.
+    """
+    match   = _compile_match(rule)
+    col_idx = col_letters_to_index(rule.column) - 1
+
+    # try/except instead of a len(row) check: the try costs (next to) nothing
+    # when the column is present, which is nearly every row; short rows read
+    # the cell as None.
+    if rule.mode == "include":
+        def predicate(row: List[Any]) -> bool:
+            try:
+                cell = row[col_idx]
+            except IndexError:
+                cell = None
+            return match(cell)
+    elif rule.mode == "exclude":
+        def predicate(row: List[Any]) -> bool:
+            try:
+                cell = row[col_idx]
+            except IndexError:
+                cell = None
+            return not match(cell)
+    else:
+        raise AppError(INVALID_RULE, f"Bad rule mode: {rule.mode!r}")
+
+    predicate.cache_clear = match.cache_clear
+    return predicate
+
+
+def _normalize_combine(combine_mode: str) -> str:
+    combine_mode = combine_mode.strip().upper()
+    if combine_mode not in ("AND", "OR"):
+        raise AppError(INVALID_RULE, f"Bad combine mode: {combine_mode!r}")
+    return combine_mode
+
+
+def _rule_key(rules: List[Rule]) -> Tuple[Tuple[Any, ...], ...]:
+    # Rule is a mutable dataclass, so key the caches on its field values.
+    return tuple((r.mode, r.column, r.operator, r.value) for r in rules)
+
+
+def _combine(rules: List[Rule], combine_mode: str) -> Callable[[List[Any]], bool]:
+    return _combine_cached(_rule_key(rules), combine_mode)
+
+
+@lru_cache(maxsize=128)
+def _compile_key(key: Tuple[Tuple[Any, ...], ...]) -> Tuple[Callable[[List[Any]], bool], ...]:
+    # The same recipe's rules are compiled on every run; the predicates are
+    # pure closures over the rule values, so they are compiled once per key.
+    # Invalid rules raise before anything is cached.
+    return tuple(
+        _compile_rule(Rule(mode=m, column=c, operator=o, value=v))
+        for m, c, o, v in key
+    )
+
+
+@lru_cache(maxsize=128)
+def _combine_cached(
+    key: Tuple[Tuple[Any, ...], ...], combine_mode: str
+) -> Callable[[List[Any]], bool]:
+    return _join(_compile_key(key), combine_mode)
+
+
+def _join(predicates, combine_mode: str) -> Callable[[List[Any]], bool]:
+    """Combine row predicates into one keep(row), short-circuiting in order."""
+    if not predicates:
+        return lambda row: True
+    if len(predicates) == 1:
+        return predicates[0]
+    # Explicit short-circuit loops: ~3x cheaper per row than all()/any()
+    # over a generator expression.
+    if combine_mode == "AND":
+        if len(predicates) == 2:
+            first, second = predicates
+            return lambda row: first(row) and second(row)
+
+        def keep(row: List[Any]) -> bool:
+            for p in predicates:
+                if not p(row):
+                    return False
+            return True
+    else:
+        if len(predicates) == 2:
+            first, second = predicates
+            return lambda row: first(row) or second(row)
+
+        def keep(row: List[Any]) -> bool:
+            for p in predicates:
+                if p(row):
+                    return True
+            return False
+    return keep
+
+
+def _by_selectivity(predicates, sample: List[List[Any]], combine_mode: str):
+    """
+    Order predicates so the one most likely to decide a row runs first:
+    lowest pass rate on the sample first for AND, highest first for OR.
+    The sort is stable, so ties keep the user's rule order.
+    """
+    rates = [sum(map(p, sample)) for p in predicates]
+    order = sorted(range(len(predicates)), key=rates.__getitem__,
+                   reverse=combine_mode == "OR")
+    return [predicates[i] for i in order]
+
+
+def compile_rules(rules: List[Rule], combine_mode: str) -> Callable[[List[Any]], bool]:
+    """
+    Compile rules + combine mode into a single row -> bool predicate.
+
+    Every rule is validated up front, so an invalid rule raises
+    AppError(INVALID_RULE) here rather than on the first row that reaches it.
+    An empty rule list keeps every row.
+
+    Each call compiles a fresh predicate, so its text memos live exactly as
+    long as the caller keeps it (apply_rules uses the cached predicates and
+    empties their memos before returning).
+    """
+    combine_mode = _normalize_combine(combine_mode)
+    return _join(tuple(_compile_rule(r) for r in rules), combine_mode)
+
+
 def apply_rules(
     rows: List[List[Any]],
     rules: List[Rule],
@@ -84,33 +299,122 @@ def apply_rules(
     Rules reference absolute source columns (col_letters_to_index converts
     them to 0-based indices). Rows shorter than the referenced column are
     treated as if that cell is None (no match, no crash).
+
+    The rules are compiled once (see compile_rules) before the row loop;
+    AND / OR short-circuit, so later rules are skipped once a row's fate is
+    decided. On longer tables the rules are first ordered by their pass rate
+    on a leading sample, so the most decisive rule runs first. Kept rows are
+    the original row objects, in input order. With no rules, rows itself is
+    returned (no copy, no combine-mode validation).
     """
     if not rules:
         return rows
 
-    combine_mode = combine_mode.strip().upper()
-    if combine_mode not in ("AND", "OR"):
-        raise AppError(INVALID_RULE, f"Bad combine mode: {combine_mode!r}")
+    combine_mode = _normalize_combine(combine_mode)
 
-    filtered = []
+    if not rows:
+        return []
 
-    for row in rows:
-        results = []
-        for rule in rules:
-            col_idx = col_letters_to_index(rule.column) - 1
-            cell    = row[col_idx] if col_idx < len(row) else None
+    keep = _combine(rules, combine_mode)     # also validates every rule
+    predicates = _compile_key(_rule_key(rules))
 
-            match = _evaluate(cell, rule)
+    # Three paths, by table size: short tables run keep() row by row as
+    # compiled; from _REORDER_MIN_ROWS the rules are reordered by sampled
+    # selectivity first; from _VECTOR_MIN_ROWS, when numpy is installed and
+    # some column is compared numerically or read twice, whole columns are
+    # converted once and filtered with boolean masks.
+    try:
+        if len(rows) >= _VECTOR_MIN_ROWS and _columnwise_pays(rules):
+            np = _numpy_or_none()
+            if np is not None:
+                return _apply_rules_columnwise(np, rows, rules, predicates, combine_mode)
+        if len(rules) > 1 and len(rows) >= _REORDER_MIN_ROWS:
+            keep = _join(
+                _by_selectivity(predicates, rows[:_SELECTIVITY_SAMPLE], combine_mode),
+                combine_mode,
+            )
+        return [row for row in rows if keep(row)]
+    finally:
+        # The predicates stay cached across runs; the cell strings they
+        # memoised during this one do not.
+        for p in predicates:
+            p.cache_clear()
 
-            if rule.mode == "include":
-                results.append(match)
-            elif rule.mode == "exclude":
-                results.append(not match)
-            else:
-                raise AppError(INVALID_RULE, f"Bad rule mode: {rule.mode!r}")
 
-        keep = all(results) if combine_mode == "AND" else any(results)
-        if keep:
-            filtered.append(row)
+def _columnwise_pays(rules: List[Rule]) -> bool:
+    """True if some rule is numeric (< / >) or two rules share a column."""
+    seen = set()
+    for r in rules:
+        if r.operator in ("<", ">"):
+            return True
+        col = r.column.strip().upper()
+        if col in seen:
+            return True
+        seen.add(col)
+    return False
+
+
+def _apply_rules_columnwise(np, rows, rules: List[Rule], predicates, combine_mode: str):
+    """
+    Column-wise apply_rules for large tables, with per-column caches shared by
+    every rule that reads the column:
+
+      < / >     — one float64 vector per column (NaN where the cell is missing
+                  or non-numeric, which compares False both ways), compared
+                  in a single vector op.
+      contains, — one list of str(cell).lower() per column (None for missing
+      equals      cells), so a cell is lower-cased once, not once per rule.
+                  equals with a numeric target keeps its compiled row
+                  predicate (predicates[i]), as it compares numerically first.
+
+    Each rule yields a boolean mask; masks are combined with AND / OR.
+    """
+    n = len(rows)
+    numbers = {}
+    texts = {}
+
+    def column(col_idx: int, convert, cache):
+        vals = cache.get(col_idx)
+        if vals is None:
+            vals = cache[col_idx] = convert(
+                row[col_idx] if col_idx < len(row) else None for row in rows
+            )
+        return vals
+
+    def to_numbers(cells):
+        return np.fromiter(map(_float_or_nan, cells), np.float64, count=n)
+
+    def to_texts(cells):
+        return [None if v is None else str(v).lower() for v in cells]
+
+    masks = []
+    for rule, predicate in zip(rules, predicates):
+        col_idx = col_letters_to_index(rule.column) - 1
+        op = rule.operator
+        if op in ("<", ">"):
+            right = _safe_numeric(rule.value)
+            if right is None:
+                hit = np.zeros(n, dtype=bool)
+            else:
+                vec = column(col_idx, to_numbers, numbers)
+                hit = vec < right if op == "<" else vec > right
+        elif op == "contains":
+            needle = rule.value.lower()
+            text = column(col_idx, to_texts, texts)
+            hit = np.fromiter((s is not None and needle in s for s in text), bool, count=n)
+        elif op == "equals" and _safe_numeric(rule.value) is None:
+            target = rule.value.strip().lower()
+            none_matches = target == ""
+            text = column(col_idx, to_texts, texts)
+            hit = np.fromiter(
+                (none_matches if s is None else s.strip() == target for s in text),
+                bool,
+                count=n,
+            )
+        else:
+            masks.append(np.fromiter(map(predicate, rows), bool, count=n))
+            continue
+        masks.append(hit if rule.mode == "include" else ~hit)
 
-    return filtered
+    reduce = np.logical_and.reduce if combine_mode == "AND" else np.logical_or.reduce
+    return [rows[i] for i in np.flatnonzero(reduce(masks)).tolist()]
@@ -29,7 +29,7 @@ from .io import load_csv, load_xlsx, compute_used_range, normalize_table
 from .rules import apply_rules
 from .transform import apply_row_selection, apply_column_selection, shape_pack, shape_keep
 from .planner import build_plan
-from .writer import apply_write_plan
+from .writer import apply_write_plan, build_write_only_workbook
 
 
 # ── Private helpers ───────────────────────────────────────────────────────────
@@ -109,6 +109,42 @@ def _get_or_create_sheet(wb: Workbook, name: str):
     return ws
 
 
+def _save_dest(wb: Workbook, dest_path: str) -> None:
+    """Save the destination workbook, mapping failures to AppError."""
+    try:
+        wb.save(dest_path)
+    except PermissionError:
+        raise AppError(
+            FILE_LOCKED,
+            f"Destination file is open in another program: {dest_path}",
+            {"path": dest_path},
+        )
+    except Exception as e:
+        raise AppError(
+            SAVE_FAILED,
+            str(e),
+            {"path": dest_path},
+        )
+
+
+def _ok_result(
+    source_path: str,
+    recipe_name: str,
+    sheet_cfg: SheetConfig,
+    rows_written: int,
+) -> SheetResult:
+    """Build the SheetResult for a completed (non-error) run."""
+    return SheetResult(
+        source_path=source_path,
+        recipe_name=recipe_name,
+        sheet_name=sheet_cfg.name,
+        dest_file=sheet_cfg.destination.file_path,
+        dest_sheet=sheet_cfg.destination.sheet_name,
+        rows_written=rows_written,
+        message="OK" if rows_written > 0 else "0 rows written",
+    )
+
+
 def _apply_row_selection_indexed(
     table: List[List[Any]],
     row_indices: List[int],
@@ -120,6 +156,54 @@ def _apply_row_selection_indexed(
     return [(i, table[i]) for i in row_indices if 0 <= i < len(table)]
 
 
+def _select_and_shape(
+    table: List[List[Any]],
+    sheet_cfg: SheetConfig,
+    row_indices: List[int],
+    col_indices: List[int],
+    used_h: int,
+    used_w: int,
+) -> List[List[Any]]:
+    """Pipeline steps 3–6 on a non-empty source table; returns the shaped grid."""
+    table = normalize_table(table)
+
+    # Step 3 — row selection: produce (abs_index, row) pairs
+    if not row_indices:
+        row_indices = list(range(used_h))
+
+    indexed_rows = _apply_row_selection_indexed(table, row_indices)
+    # indexed_rows: [(abs_idx, row), ...]
+
+    # Step 4 — rules filtering on full-width rows
+    # Pass only the row values to apply_rules, then re-pair with indices.
+    rows_only = [row for _, row in indexed_rows]
+    filtered_rows = apply_rules(rows_only, sheet_cfg.rules, sheet_cfg.rules_combine)
+
+    # Recover which absolute indices survived by walking indexed_rows in order.
+    # apply_rules preserves order and returns a strict subset, so we can
+    # consume filtered_rows sequentially while scanning indexed_rows.
+    survived_abs_indices: List[int] = []
+    filt_pos = 0
+    for abs_idx, row in indexed_rows:
+        if filt_pos < len(filtered_rows) and filtered_rows[filt_pos] is row:
+            survived_abs_indices.append(abs_idx)
+            filt_pos += 1
+
+    # Step 5 — column selection
+    if not col_indices:
+        col_indices = list(range(used_w))
+
+    selected = apply_column_selection(filtered_rows, col_indices)
+
+    # Step 6 — shape
+    if sheet_cfg.paste_mode == "keep":
+        shaped = shape_keep(table, survived_abs_indices, col_indices)
+    else:
+        shaped = shape_pack(selected)
+
+    return shaped
+
+
 # ── Public API ────────────────────────────────────────────────────────────────
 
 def run_sheet(
@@ -141,11 +225,19 @@ def run_sheet(
       7. Plan destination placement
       8. Collision check + write
 
+    An empty source (after the start row offset) skips steps 3–6 and lands
+    zero rows like a fully filtered run: the destination file and sheet are
+    still created if missing.
+
     For keep mode, shape_keep receives only the post-rules absolute row indices
     so that rules correctly exclude rows from the spatial output.
 
     _wb_cache: optional dict keyed by dest_path. When provided (by batch.run_all),
-               the workbook is NOT saved here. When None (standalone), saves here.
+               the workbook is NOT saved here; a pre-seeded entry (e.g. an
+               in-memory Workbook) is written in place with no disk I/O at all.
+               When None (standalone), saves here;
+               a destination file that does not exist yet is written in
+               openpyxl write-only mode.
     """
     dest_path = sheet_cfg.destination.file_path
     if not (dest_path or "").strip():
@@ -158,47 +250,35 @@ def run_sheet(
     table = _apply_source_start_row(table, getattr(sheet_cfg, "source_start_row", ""))
 
     used_h, used_w = compute_used_range(table)
-    table = normalize_table(table)
 
-    # Step 3 — row selection: produce (abs_index, row) pairs
+    # Specs are validated up front so bad input still raises on an empty source.
     row_indices = parse_rows(sheet_cfg.rows_spec)
-    if not row_indices:
-        row_indices = list(range(used_h))
-
-    indexed_rows = _apply_row_selection_indexed(table, row_indices)
-    # indexed_rows: [(abs_idx, row), ...]
-
-    # Step 4 — rules filtering on full-width rows
-    # Pass only the row values to apply_rules, then re-pair with indices.
-    rows_only = [row for _, row in indexed_rows]
-    filtered_rows = apply_rules(rows_only, sheet_cfg.rules, sheet_cfg.rules_combine)
-
-    # Recover which absolute indices survived by walking indexed_rows in order.
-    # apply_rules preserves order and returns a strict subset, so we can
-    # consume filtered_rows sequentially while scanning indexed_rows.
-    survived_abs_indices: List[int] = []
-    filt_pos = 0
-    for abs_idx, row in indexed_rows:
-        if filt_pos < len(filtered_rows) and filtered_rows[filt_pos] is row:
-            survived_abs_indices.append(abs_idx)
-            filt_pos += 1
-
-    # Step 5 — column selection
     col_indices = parse_columns(sheet_cfg.columns_spec)
-    if not col_indices:
-        col_indices = list(range(used_w))
 
-    selected = apply_column_selection(filtered_rows, col_indices)
-
-    # Step 6 — shape
-    if sheet_cfg.paste_mode == "keep":
-        shaped = shape_keep(table, survived_abs_indices, col_indices)
+    # Empty source: nothing to select or shape. The destination is still
+    # opened/created below, exactly as for a run whose rules filter every row.
+    if used_h == 0:
+        shaped: List[List[Any]] = []
     else:
-        shaped = shape_pack(selected)
+        shaped = _select_and_shape(table, sheet_cfg, row_indices, col_indices,
+                                   used_h, used_w)
 
     # Steps 7–8 — plan, collision check, write
     standalone = _wb_cache is None
 
+    if standalone and not os.path.exists(dest_path):
+        # Brand-new destination: nothing can collide, so plan against a blank
+        # sheet and stream the rows out through a write-only workbook.
+        plan = build_plan(
+            Workbook().active, shaped,
+            sheet_cfg.destination.start_col,
+            sheet_cfg.destination.start_row,
+        )
+        rows_written = len(shaped) if plan is not None else 0
+        wb = build_write_only_workbook(sheet_cfg.destination.sheet_name, shaped, plan)
+        _save_dest(wb, dest_path)
+        return _ok_result(source_path, recipe_name, sheet_cfg, rows_written)
+
     if standalone:
         wb = _open_or_create_dest(dest_path)
     else:
@@ -206,6 +286,7 @@ def run_sheet(
             _wb_cache[dest_path] = _open_or_create_dest(dest_path)
         wb = _wb_cache[dest_path]
 
+    sheet_created = sheet_cfg.destination.sheet_name not in wb.sheetnames
     ws = _get_or_create_sheet(wb, sheet_cfg.destination.sheet_name)
 
     plan = build_plan(
@@ -217,28 +298,11 @@ def run_sheet(
     if plan is not None:
         rows_written = apply_write_plan(ws, shaped, plan)
 
-    if standalone and dest_path:
-        try:
-            wb.save(dest_path)
-        except PermissionError:
-            raise AppError(
-                FILE_LOCKED,
-                f"Destination file is open in another program: {dest_path}",
-                {"path": dest_path},
-            )
-        except Exception as e:
-            raise AppError(
-                SAVE_FAILED,
-                str(e),
-                {"path": dest_path},
-            )
+    # Nothing written to an existing sheet of an existing file: the workbook
+    # is unchanged, so skip the (expensive) full re-serialisation.
+    unchanged = rows_written == 0 and not sheet_created and os.path.exists(dest_path)
 
-    return SheetResult(
-        source_path=source_path,
-        recipe_name=recipe_name,
-        sheet_name=sheet_cfg.name,
-        dest_file=dest_path,
-        dest_sheet=sheet_cfg.destination.sheet_name,
-        rows_written=rows_written,
-        message="OK" if rows_written > 0 else "0 rows written",
-    )
+    if standalone and dest_path and not unchanged:
+        _save_dest(wb, dest_path)
+
+    return _ok_result(source_path, recipe_name, sheet_cfg, rows_written)
@@ -1,14 +1,13 @@
 from __future__ import annotations
 
-import json
 import os
 from copy import deepcopy
-from dataclasses import asdict
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from . import jsonio
 from .models import Destination, Rule, SheetConfig
-from .project import RecipeConfig, SourceConfig
+from .project import RecipeConfig, SourceConfig, sheet_to_dict
 
 
 ENV_DEFAULT_TEMPLATE_PATH = "TURBO_DEFAULT_TEMPLATE_PATH"
@@ -38,10 +37,10 @@ def source_to_template(source: SourceConfig) -> Dict[str, Any]:
 
     Template intentionally excludes the Source path.
     """
-    recipes = []
-    for r in source.recipes:
-        sheets = [asdict(sh) for sh in r.sheets]
-        recipes.append({"name": r.name, "sheets": sheets})
+    recipes = [
+        {"name": r.name, "sheets": [sheet_to_dict(sh) for sh in r.sheets]}
+        for r in source.recipes
+    ]
     return {"version": 1, "recipes": recipes}
 
 
@@ -76,12 +75,12 @@ def apply_template_to_source(source: SourceConfig, template: Dict[str, Any]) ->
 def save_template_json(template: Dict[str, Any], path: str) -> None:
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps(template, indent=2), encoding="utf-8")
+    p.write_bytes(jsonio.dumps(template, indent=True))
 
 
 def load_template_json(path: str) -> Dict[str, Any]:
     p = Path(path)
-    return json.loads(p.read_text(encoding="utf-8"))
+    return jsonio.loads(p.read_bytes())
 
 
 def set_default_template(template: Dict[str, Any], path: Optional[str] = None) -> str:
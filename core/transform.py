@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from operator import itemgetter
 from typing import List, Any
 
 
@@ -27,16 +28,22 @@ def apply_column_selection(
     if not col_indices:
         return rows
 
-    selected = []
-    for row in rows:
-        new_row = []
-        for c in col_indices:
-            if 0 <= c < len(row):
-                new_row.append(row[c])
-            else:
-                new_row.append(None)
-        selected.append(new_row)
-    return selected
+    # Rows wide enough for every index take one C-level itemgetter call;
+    # short (ragged) rows and negative indices fall back to per-cell padding.
+    if len(col_indices) > 1 and min(col_indices) >= 0:
+        need = max(col_indices) + 1
+        pick = itemgetter(*col_indices)
+        return [list(pick(row)) if len(row) >= need else _pick_padded(row, col_indices)
+                for row in rows]
+    if len(col_indices) == 1:
+        c = col_indices[0]
+        return [[row[c] if 0 <= c < len(row) else None] for row in rows]
+    return [_pick_padded(row, col_indices) for row in rows]
+
+
+def _pick_padded(row: List[Any], col_indices: List[int]) -> List[Any]:
+    width = len(row)
+    return [row[c] if 0 <= c < width else None for c in col_indices]
 
 
 def shape_pack(rows: List[List[Any]]) -> List[List[Any]]:
@@ -75,21 +82,24 @@ def shape_keep(
         selected_col_indices = list(range(len(original_rows[0])))
 
     min_c = min(selected_col_indices)
-    max_c = max(selected_col_indices)
-    col_set = set(selected_col_indices)
+    width = max(selected_col_indices) - min_c + 1
+    # (source col, output slot) for the selected columns only: each row starts
+    # as a C-level [None] * width and only selected cells are filled, so the
+    # work per row tracks the selection rather than the bounding-box width.
+    fill = [(c, c - min_c) for c in sorted(set(selected_col_indices))]
 
     shaped = []
-
+    n_rows = len(original_rows)
     for r in selected_row_indices:
-        if r >= len(original_rows):
+        if r >= n_rows:
             continue
-        row = []
-        for c in range(min_c, max_c + 1):
-            if c in col_set:
-                src_row = original_rows[r]
-                row.append(src_row[c] if c < len(src_row) else None)
-            else:
-                row.append(None)
+        src_row = original_rows[r]
+        n = len(src_row)
+        row = [None] * width
+        for c, k in fill:
+            if c < n:
+                row[k] = src_row[c]
         shaped.append(row)
 
     return shaped
+
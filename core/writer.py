@@ -7,13 +7,19 @@ ws.max_row and ws.max_column. This corrupts subsequent append scans.
 
 Gap cells (None) from Keep Format bounding boxes are simply skipped —
 their absence in the destination is correct and intentional.
+
+For a destination file that does not exist yet, build_write_only_workbook
+streams the same rows into a write-only workbook instead (no in-memory cell
+grid; the write-only serialiser drops None cells on its own).
 """
 from __future__ import annotations
 
-from typing import Any, List
+from typing import Any, List, Optional
 
+from openpyxl import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
 
+from .landing import note_rows_written
 from .planner import WritePlan
 
 
@@ -34,14 +40,45 @@ def apply_write_plan(
     if not shaped:
         return 0
 
-    for r_offset, row in enumerate(shaped):
-        for c_offset, value in enumerate(row):
+    # ws.append() cannot be used here: it always starts at column A on the row
+    # after ws.max_row and materialises a cell for every None it is given.
+    # Instead, hoist the bound method and compute each row number once.
+    cell = ws.cell
+    start_col = plan.start_col
+    for row_num, row in enumerate(shaped, plan.start_row):
+        for col_num, value in enumerate(row, start_col):
             if value is None:
                 continue          # gap cell — do not write
-            ws.cell(
-                row=plan.start_row + r_offset,
-                column=plan.start_col + c_offset,
-                value=value,
-            )
+            cell(row=row_num, column=col_num, value=value)
 
+    note_rows_written(ws, plan.start_row, start_col, shaped)
     return len(shaped)
+
+
+def build_write_only_workbook(
+    sheet_name: str,
+    shaped: List[List[Any]],
+    plan: Optional[WritePlan],
+) -> Workbook:
+    """
+    Build a write-only workbook holding a single sheet with shaped data placed
+    according to plan. Only valid for a brand-new destination file, where the
+    plan was made against a blank sheet.
+
+    Rows above plan.start_row are emitted empty and columns left of
+    plan.start_col are padded with None, which is never serialised.
+    The caller saves the returned workbook (write-only workbooks save once).
+    """
+    wb = Workbook(write_only=True)
+    # A blank name gets the same default the normal-mode path ends up with
+    # ("Sheet1": created next to openpyxl's default "Sheet", which is dropped).
+    ws = wb.create_sheet(title=sheet_name or "Sheet1")
+    if plan is None or not shaped:
+        return wb
+
+    for _ in range(plan.start_row - 1):
+        ws.append([])
+    pad = [None] * (plan.start_col - 1)
+    for row in shaped:
+        ws.append(pad + list(row))
+    return wb
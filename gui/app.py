@@ -14,7 +14,7 @@ from core.models import SheetConfig, Destination, Rule
 from core import templates as tpl
 from core.engine import run_all as engine_run_all, run_sheet as engine_run_sheet
 from core.errors import AppError, friendly_message
-from core.autosave import resolve_autosave_path, save_project_atomic, load_project_if_exists
+from core.autosave import resolve_autosave_path, save_project_if_changed, load_project_if_exists
 
 
 class TurboExtractorApp(ReportMixin, TreeMixin, EditorMixin, ThrobberMixin, tk.Tk):
@@ -54,6 +54,7 @@ class TurboExtractorApp(ReportMixin, TreeMixin, EditorMixin, ThrobberMixin, tk.T
         self._autosave_after_id: Optional[str] = None
         self._autosave_periodic_id: Optional[str] = None
         self._autosave_path: str = resolve_autosave_path()
+        self._autosave_digest: Optional[bytes] = None
 
         self._build_ui()
         self._try_load_autosave()
@@ -89,12 +90,18 @@ class TurboExtractorApp(ReportMixin, TreeMixin, EditorMixin, ThrobberMixin, tk.T
         self._schedule_debounced_autosave()
 
     def _schedule_debounced_autosave(self) -> None:
+        # Coalesce: a burst of edits (e.g. a run of moves) shares the one
+        # pending save instead of cancelling and re-arming a timer per edit.
+        if self._autosave_after_id is None:
+            self._autosave_after_id = self.after(1200, self._autosave_now)
+
+    def _cancel_autosave_timer(self) -> None:
         if self._autosave_after_id is not None:
             try:
                 self.after_cancel(self._autosave_after_id)
             except Exception:
                 pass
-        self._autosave_after_id = self.after(1200, self._autosave_now)
+            self._autosave_after_id = None
 
     def _schedule_periodic_autosave(self) -> None:
         self._autosave_periodic_id = self.after(45000, self._periodic_autosave_tick)
@@ -105,10 +112,15 @@ class TurboExtractorApp(ReportMixin, TreeMixin, EditorMixin, ThrobberMixin, tk.T
         self._schedule_periodic_autosave()
 
     def _autosave_now(self) -> None:
+        self._cancel_autosave_timer()
         if not self._autosave_dirty:
             return
         try:
-            save_project_atomic(self.project, self._autosave_path)
+            # Edits that net out to no change (e.g. a move up then down) skip
+            # the disk write; the digest tracks what is already on disk.
+            self._autosave_digest = save_project_if_changed(
+                self.project, self._autosave_path, self._autosave_digest
+            )
             self._autosave_dirty = False
         except Exception:
             pass
@@ -194,6 +206,15 @@ class TurboExtractorApp(ReportMixin, TreeMixin, EditorMixin, ThrobberMixin, tk.T
 
     # ── Project-level add / remove ────────────────────────────────────────────
 
+    def add_source(self, src: SourceConfig) -> str:
+        """
+        Append a Source to the project and insert just its subtree, leaving the
+        rest of the tree (and any captured item ids) untouched. Returns the new
+        tree item id. Callers mark dirty once after a batch of additions.
+        """
+        self.project.sources.append(src)
+        return self._insert_source_subtree(src)
+
     def add_sources(self) -> None:
         paths = filedialog.askopenfilenames(
             title="Add source file(s)",
@@ -217,9 +238,9 @@ class TurboExtractorApp(ReportMixin, TreeMixin, EditorMixin, ThrobberMixin, tk.T
                 sheet = self._make_default_sheet(name="Sheet1")
                 recipe = RecipeConfig(name="Recipe1", sheets=[sheet])
                 src.recipes = [recipe]
-            self.project.sources.append(src)
+            self.add_source(src)
 
-        self.refresh_tree()
+        self._sync_right_panel_visibility()
         self._mark_dirty()
 
     def add_recipe(self) -> None:
@@ -288,6 +309,7 @@ class TurboExtractorApp(ReportMixin, TreeMixin, EditorMixin, ThrobberMixin, tk.T
 
         if len(path) == 1:
             del self.project.sources[path[0]]
+            self._remove_source_subtree(path[0])
         elif len(path) == 2:
             del self.project.sources[path[0]].recipes[path[1]]
         elif len(path) == 3:
@@ -300,7 +322,10 @@ class TurboExtractorApp(ReportMixin, TreeMixin, EditorMixin, ThrobberMixin, tk.T
         self.current_sheet = None
         self.current_source_path = None
         self.current_recipe_name = None
-        self.refresh_tree()
+        if len(path) == 1:
+            self._sync_right_panel_visibility()
+        else:
+            self.refresh_tree()
         self._clear_editor()
         self._mark_dirty()
         self._reselect_after_remove(path)
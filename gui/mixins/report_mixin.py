@@ -17,6 +17,7 @@ class ReportMixin:
     _classify_report_line(line) -> str   [static]
     _report_font(bold) -> tuple          [static]
     _show_scrollable_report_dialog(title, text) -> None
+    _fill_report_dialog(title, text) -> None
     """
 
     def _format_run_report(self, report) -> str:
@@ -116,16 +117,23 @@ class ReportMixin:
         return (name, 9, "bold" if bold else "normal")
 
     def _show_scrollable_report_dialog(self, title: str, text: str) -> None:
-        if getattr(self, "_report_dialog", None) is not None:
+        # Recycle a still-open dialog: retitle it and swap the text in place
+        # instead of tearing down and rebuilding the whole widget tree.
+        win = getattr(self, "_report_dialog", None)
+        if win is not None:
             try:
-                self._report_dialog.destroy()
+                alive = bool(win.winfo_exists())
             except Exception:
-                pass
+                alive = False
+            if alive:
+                self._fill_report_dialog(title, text)
+                win.deiconify()
+                win.lift()
+                return
             self._report_dialog = None
 
         win = tk.Toplevel(self)
         self._report_dialog = win
-        win.title(title)
         win.transient(self)
         win.grab_set()
         win.minsize(740, 440)
@@ -148,6 +156,7 @@ class ReportMixin:
             padx=8,
             pady=6,
         )
+        self._report_text = txt
         vsb = ttk.Scrollbar(container, orient="vertical",   command=txt.yview)
         hsb = ttk.Scrollbar(container, orient="horizontal", command=txt.xview)
         txt.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
@@ -161,17 +170,14 @@ class ReportMixin:
         txt.tag_configure("meta",     foreground="#555555", font=self._report_font())
         txt.tag_configure("plain",    foreground="#111111", font=self._report_font())
 
-        for line in text.splitlines():
-            txt.insert("end", line + "\n", self._classify_report_line(line))
-
-        txt.configure(state="disabled")
+        self._fill_report_dialog(title, text)
 
         btn_row = ttk.Frame(container)
         btn_row.grid(row=2, column=0, columnspan=2, sticky="e", pady=(8, 0))
 
         def _copy_to_clipboard():
             win.clipboard_clear()
-            win.clipboard_append(text)
+            win.clipboard_append(self._report_body)
 
         ttk.Button(btn_row, text="Copy to Clipboard",
                    command=_copy_to_clipboard).pack(side="left", padx=(0, 8))
@@ -186,3 +192,21 @@ class ReportMixin:
         x = max(0, int((sw - w) / 2))
         y = max(0, int((sh - h) / 2))
         win.geometry(f"{w}x{h}+{x}+{y}")
+
+    def _fill_report_dialog(self, title: str, text: str) -> None:
+        """Set the open report dialog's title and (read-only) report text."""
+        self._report_dialog.title(title)
+        self._report_body = text
+
+        txt = self._report_text
+        txt.configure(state="normal")
+        txt.delete("1.0", "end")
+        # Text.insert takes alternating chars/tags pairs: push the whole
+        # report in one Tk call rather than one round-trip per line.
+        tagged = []
+        for line in text.splitlines():
+            tagged += (line + "\n", self._classify_report_line(line))
+        if tagged:
+            txt.insert("end", *tagged)
+        txt.configure(state="disabled")
+        txt.yview_moveto(0)
@@ -19,21 +19,32 @@ class TreeMixin:
     # ── Tree display ──────────────────────────────────────────────────────────
 
     def refresh_tree(self) -> None:
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # One Tcl call per node: clear in a single delete and open parents as
+        # they are inserted rather than with a follow-up item() call.
+        tree = self.tree
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
 
         for source in self.project.sources:
-            label = self._source_label(source)
-            s_id = self.tree.insert("", "end", text=label)
-            self.tree.item(s_id, open=True)
-            for recipe in source.recipes:
-                r_id = self.tree.insert(s_id, "end", text=recipe.name)
-                self.tree.item(r_id, open=True)
-                for sheet in recipe.sheets:
-                    self.tree.insert(r_id, "end", text=sheet.name)
+            self._insert_source_subtree(source)
 
         self._sync_right_panel_visibility()
 
+    def _insert_source_subtree(self, source: SourceConfig) -> str:
+        """Append one Source node with its Recipes/Sheets; return its item id."""
+        tree = self.tree
+        s_id = tree.insert("", "end", text=self._source_label(source), open=True)
+        for recipe in source.recipes:
+            r_id = tree.insert(s_id, "end", text=recipe.name, open=True)
+            for sheet in recipe.sheets:
+                tree.insert(r_id, "end", text=sheet.name)
+        return s_id
+
+    def _remove_source_subtree(self, index: int) -> None:
+        """Drop the index-th Source node (and everything under it)."""
+        self.tree.delete(self.tree.get_children("")[index])
+
     # ── Path helpers ──────────────────────────────────────────────────────────
 
     def _get_tree_path(self, item_id):
@@ -0,0 +1,26 @@
+"""
+conftest.py — Fixtures shared across test modules.
+
+Plain helper functions live in tests/helpers.py.
+"""
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def tk_root():
+    """
+    One hidden Tk root per session (per xdist worker). Tests hang their
+    widgets off a Toplevel of it instead of paying Tk startup each time.
+    Skips the requesting test when Tcl/Tk is unusable.
+    """
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+        tk.Frame(root)      # catches Tcl init failures a bare Tk() misses
+    except Exception:
+        pytest.skip("Tcl/Tk not available")
+    root.withdraw()
+    yield root
+    root.destroy()
@@ -0,0 +1,178 @@
+"""
+helpers.py — Plain helper functions shared across test modules.
+
+  - make_cfg:          per-test SheetConfig with the shared defaults
+  - write_xlsx:        write a single-sheet fixture workbook (cached bytes)
+  - write_xlsx_sheets: write a multi-sheet fixture workbook (cached bytes)
+  - write_csv:         write a CSV fixture
+  - sheet_cells:       {address: value} for one dest sheet, read from the xlsx zip
+"""
+from __future__ import annotations
+
+import csv
+import functools
+import os
+import xml.etree.ElementTree as ET
+import zipfile
+from dataclasses import replace
+from io import BytesIO
+from pathlib import Path
+
+from openpyxl import Workbook
+
+from core.models import Destination, SheetConfig
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# CONFIG FACTORY
+# ══════════════════════════════════════════════════════════════════════════════
+
+_DEFAULT_DEST = Destination(file_path="", sheet_name="Out", start_col="A", start_row="")
+_DEFAULT_CFG = SheetConfig(destination=_DEFAULT_DEST)
+
+
+def make_cfg(dest_path, *, columns="", rows="", mode="pack", rules=None,
+             combine="AND", start_col="A", start_row="", dest_sheet="Out",
+             src_sheet="Sheet1", src_start_row=""):
+    """Per-test SheetConfig: shared defaults, only the varied fields replaced."""
+    return replace(
+        _DEFAULT_CFG,
+        name=src_sheet,
+        workbook_sheet=src_sheet,
+        source_start_row=src_start_row,
+        columns_spec=columns,
+        rows_spec=rows,
+        paste_mode=mode,
+        rules_combine=combine,
+        rules=list(rules or []),
+        destination=replace(
+            _DEFAULT_DEST,
+            file_path=dest_path,
+            sheet_name=dest_sheet,
+            start_col=start_col,
+            start_row=start_row,
+        ),
+    )
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# XLSX FIXTURES
+# ══════════════════════════════════════════════════════════════════════════════
+
+@functools.lru_cache(maxsize=None)
+def _xlsx_bytes(sheets):
+    """
+    Serialized write-only workbook, built once per distinct ((name, rows), ...):
+    rows are streamed straight to XML with no Cell objects built.
+    """
+    wb = Workbook(write_only=True)
+    for name, rows in sheets:
+        ws = wb.create_sheet(title=name)
+        for row in rows:
+            ws.append(row)
+    buf = BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+def write_xlsx_sheets(path, sheets):
+    """Write a fixture workbook from {sheet_name: rows}; returns path."""
+    key = tuple((name, tuple(tuple(r) for r in rows)) for name, rows in sheets.items())
+    Path(path).write_bytes(_xlsx_bytes(key))
+    return path
+
+
+def write_xlsx(path, data=(), sheet="Sheet1"):
+    """Write a one-sheet fixture workbook of rows ``data``; returns path."""
+    return write_xlsx_sheets(path, {sheet: data})
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# CSV FIXTURES
+# ══════════════════════════════════════════════════════════════════════════════
+
+_CSV_SPECIAL = (",", '"', "\r", "\n")
+
+
+def write_csv(path, data):
+    """
+    Write a CSV fixture; returns path. Non-empty string cells with no
+    delimiters, quotes or line breaks need no quoting, so they are written as
+    raw bytes and the csv module is skipped; anything else uses csv.writer.
+    """
+    plain = all(
+        isinstance(v, str) and v and not any(ch in v for ch in _CSV_SPECIAL)
+        for row in data for v in row
+    )
+    if plain:
+        with open(path, "wb") as f:
+            f.write(b"\n".join(",".join(row).encode("utf-8") for row in data))
+        return path
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerows(data)
+    return path
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# XLSX READING
+# ══════════════════════════════════════════════════════════════════════════════
+
+_NS_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_NS_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_NS_PKG = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+
+def _xml_number(text):
+    return float(text) if any(ch in text for ch in ".eE") else int(text)
+
+
+@functools.lru_cache(maxsize=None)
+def _sheet_cells(path, sheet, stamp):
+    # ``stamp`` (mtime_ns, size) keys the cache so rewritten files are re-read.
+    with zipfile.ZipFile(path) as zf:
+        rels = {rel.get("Id"): rel.get("Target")
+                for rel in ET.fromstring(zf.read("xl/_rels/workbook.xml.rels"))
+                .iter(f"{_NS_PKG}Relationship")}
+        book = ET.fromstring(zf.read("xl/workbook.xml"))
+        target = next(rels[el.get(f"{_NS_REL}id")]
+                      for el in book.iter(f"{_NS_MAIN}sheet")
+                      if el.get("name") == sheet)
+        target = target.lstrip("/") if target.startswith("/") else "xl/" + target
+        shared = []
+        if "xl/sharedStrings.xml" in zf.namelist():
+            shared = ["".join(t.text or "" for t in si.iter(f"{_NS_MAIN}t"))
+                      for si in ET.fromstring(zf.read("xl/sharedStrings.xml"))
+                      .iter(f"{_NS_MAIN}si")]
+        cells = {}
+        for _, el in ET.iterparse(BytesIO(zf.read(target))):
+            if el.tag != f"{_NS_MAIN}c":
+                continue
+            ref, kind = el.get("r"), el.get("t", "n")
+            f, v = el.find(f"{_NS_MAIN}f"), el.find(f"{_NS_MAIN}v")
+            text = None if v is None else v.text
+            if f is not None:
+                cells[ref] = "=" + (f.text or "")
+            elif kind == "inlineStr":
+                cells[ref] = "".join(t.text or "" for t in el.iter(f"{_NS_MAIN}t"))
+            elif text is None:
+                pass
+            elif kind == "s":
+                cells[ref] = shared[int(text)]
+            elif kind == "b":
+                cells[ref] = text == "1"
+            elif kind == "str":
+                cells[ref] = text
+            else:
+                cells[ref] = _xml_number(text)
+            el.clear()
+        return cells
+
+
+def sheet_cells(path, sheet="Out"):
+    """
+    {address: value} for one worksheet, read straight from the xlsx zip (no
+    openpyxl load). Covers shared/inline strings, numbers, bools and
+    formulas (as "=..."). Cached per file stamp; returns a fresh dict.
+    """
+    st = os.stat(path)
+    return dict(_sheet_cells(path, sheet, (st.st_mtime_ns, st.st_size)))
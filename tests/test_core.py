@@ -13,17 +13,16 @@ Covers:
 """
 from __future__ import annotations
 
-import csv
-import os
-from pathlib import Path
-from tempfile import TemporaryDirectory
+import re
+import zipfile
 
 import pytest
-from openpyxl import Workbook, load_workbook
+from openpyxl import Workbook
+from openpyxl.utils import get_column_letter
 
 from core.errors import AppError, BAD_SPEC, DEST_BLOCKED, INVALID_RULE
 from core.io import compute_used_range, is_occupied, load_xlsx, normalize_table
-from core.models import Destination, Rule, SheetConfig
+from core.models import Rule
 from core.parsing import (
     col_index_to_letters,
     col_letters_to_index,
@@ -39,85 +38,56 @@ from core.transform import (
     shape_pack,
 )
 from core.writer import apply_write_plan
+from tests.helpers import write_xlsx, write_xlsx_sheets
+
+
+# Module-scoped fixtures: keep this file on one xdist worker (--dist=loadgroup)
+pytestmark = pytest.mark.xdist_group("core")
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 # HELPERS
 # ══════════════════════════════════════════════════════════════════════════════
 
-def _fresh_ws():
-    wb = Workbook()
-    return wb, wb.active
-
-
-def _ws():
-    """Return a fresh in-memory worksheet."""
-    return Workbook().active
+@pytest.fixture(scope="module")
+def _pool_wb():
+    return Workbook()
 
 
-def _xlsx(path: str, sheet: str = "Sheet1", data=None):
-    wb = Workbook()
-    ws = wb.active
-    ws.title = sheet
-    for r, row in enumerate(data or [], 1):
-        for c, v in enumerate(row, 1):
-            ws.cell(row=r, column=c, value=v)
-    wb.save(path)
-    return path
+@pytest.fixture
+def ws(_pool_wb):
+    """
+    Fresh in-memory worksheet. Sheets are recycled on one module-wide
+    Workbook, so only a Worksheet (not a whole Workbook) is built per test.
+    """
+    for old in _pool_wb.worksheets:
+        _pool_wb.remove(old)
+    return _pool_wb.create_sheet("Sheet")
 
 
 # ══════════════════════════════════════════════════════════════════════════════
-# CORE.IO — is_occupied
+# CORE.IO / CORE.PLANNER — is_occupied, is_cell_occupied
 # ══════════════════════════════════════════════════════════════════════════════
 
-def test_is_occupied_none_is_false():
-    assert is_occupied(None) is False
-
-
-def test_is_occupied_empty_string_is_false():
-    assert is_occupied("") is False
-
-
-def test_is_occupied_whitespace_is_true():
-    assert is_occupied(" ") is True
-
-
-def test_is_occupied_zero_is_true():
-    assert is_occupied(0) is True
-
-
-def test_is_occupied_zero_float_is_true():
-    assert is_occupied(0.0) is True
-
-
-def test_is_occupied_false_bool_is_true():
-    assert is_occupied(False) is True
-
-
-def test_is_occupied_true_bool_is_true():
-    assert is_occupied(True) is True
-
-
-def test_is_occupied_text_is_true():
-    assert is_occupied("text") is True
-
-
-def test_is_occupied_integer_is_true():
-    assert is_occupied(42) is True
-
-
-def test_is_occupied_empty_list_is_true():
-    assert is_occupied([]) is True
-
-
-def test_is_occupied_empty_dict_is_true():
-    assert is_occupied({}) is True
-
-
-def test_is_occupied_formula_string_is_occupied():
-    """io.is_occupied has no formula special-case — formula strings ARE occupied."""
-    assert is_occupied("=SUM(A1:A10)") is True
-    assert is_occupied("=A1+B1") is True
+@pytest.mark.parametrize("val, expected_occ, expected_cell_occ", [
+    (None,           False, False),
+    ("",             False, False),
+    (" ",            True,  True),
+    ("hello",        True,  True),
+    (0,              True,  True),
+    (0.0,            True,  True),
+    (False,          True,  True),
+    (True,           True,  True),
+    (42,             True,  True),
+    ([],             True,  True),
+    ({},             True,  True),
+    # io.is_occupied has no formula special-case; the planner's dest scan
+    # treats formula strings (start with '=') as unoccupied.
+    ("=SUM(A1:A10)", True,  False),
+    ("=A1+B1",       True,  False),
+], ids=repr)
+def test_is_occupied_and_is_cell_occupied(val, expected_occ, expected_cell_occ):
+    assert (is_occupied(val), is_cell_occupied(val)) == (expected_occ, expected_cell_occ)
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -174,14 +144,10 @@ def test_compute_used_range_empty_returns_zero():
 # ══════════════════════════════════════════════════════════════════════════════
 
 def test_load_xlsx_reads_only_specified_sheet(tmp_path):
-    wb = Workbook()
-    ws1 = wb.active
-    ws1.title = "Sheet1"
-    ws1["A1"] = "from_sheet1"
-    ws2 = wb.create_sheet("Sheet2")
-    ws2["A1"] = "from_sheet2"
-    path = str(tmp_path / "multi.xlsx")
-    wb.save(path)
+    path = write_xlsx_sheets(str(tmp_path / "multi.xlsx"), {
+        "Sheet1": [["from_sheet1"]],
+        "Sheet2": [["from_sheet2"]],
+    })
 
     rows1 = load_xlsx(path, "Sheet1")
     rows2 = load_xlsx(path, "Sheet2")
@@ -190,13 +156,7 @@ def test_load_xlsx_reads_only_specified_sheet(tmp_path):
 
 
 def test_load_xlsx_sheet_with_only_empty_strings_used_range_zero(tmp_path):
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Sheet1"
-    ws["A1"] = ""
-    ws["B2"] = ""
-    path = str(tmp_path / "empty_strings.xlsx")
-    wb.save(path)
+    path = write_xlsx(str(tmp_path / "empty_strings.xlsx"), data=[[""], [None, ""]])
 
     rows = load_xlsx(path, "Sheet1")
     h, w = compute_used_range(rows)
@@ -204,49 +164,41 @@ def test_load_xlsx_sheet_with_only_empty_strings_used_range_zero(tmp_path):
     assert w == 0
 
 
-def test_load_xlsx_missing_sheet_raises(tmp_path):
+def test_load_xlsx_keeps_gaps_and_ignores_stale_dimension(tmp_path):
+    """Read-only streaming must keep blank rows/cols and not trust <dimension>."""
+    path = tmp_path / "sparse.xlsx"
     wb = Workbook()
-    wb.active.title = "Sheet1"
-    path = str(tmp_path / "s.xlsx")
+    wb.active["B1"] = "top"
+    wb.active["D4"] = 7
     wb.save(path)
-    with pytest.raises(Exception):
-        load_xlsx(path, "DoesNotExist")
-
-
-# ══════════════════════════════════════════════════════════════════════════════
-# CORE.PLANNER — is_cell_occupied
-# ══════════════════════════════════════════════════════════════════════════════
-
-def test_is_cell_occupied_matches_is_occupied_for_common_values():
-    """Both functions agree on all common values."""
-    test_cases = [
-        (None,   False),
-        ("",     False),
-        ("hello", True),
-        (0,      True),
-        (0.0,    True),
-        (False,  True),
-        (True,   True),
-        (42,     True),
-        (" ",    True),
+    # Rewrite the sheet's stored dimension to A1 only, as some writers leave it.
+    with zipfile.ZipFile(path) as zf:
+        parts = {name: zf.read(name) for name in zf.namelist()}
+    sheet = "xl/worksheets/sheet1.xml"
+    parts[sheet] = re.sub(rb'<dimension ref="[^"]*"', b'<dimension ref="A1"', parts[sheet])
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, data in parts.items():
+            zf.writestr(name, data)
+
+    assert load_xlsx(str(path), "Sheet") == [
+        [None, "top", None, None],
+        [None, None, None, None],
+        [None, None, None, None],
+        [None, None, None, 7],
     ]
-    for val, expected in test_cases:
-        assert is_occupied(val) == expected,      f"is_occupied({val!r}) should be {expected}"
-        assert is_cell_occupied(val) == expected, f"is_cell_occupied({val!r}) should be {expected}"
 
 
-def test_is_cell_occupied_formula_string_treated_as_unoccupied():
-    """Planner-specific: formula strings (start with '=') are unoccupied in dest scan."""
-    assert is_cell_occupied("=SUM(A1:A10)") is False
-    assert is_cell_occupied("=A1+B1") is False
+def test_load_xlsx_missing_sheet_raises(tmp_path):
+    path = write_xlsx(str(tmp_path / "s.xlsx"))
+    with pytest.raises(Exception):
+        load_xlsx(path, "DoesNotExist")
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 # CORE.PLANNER — build_plan append mode
 # ══════════════════════════════════════════════════════════════════════════════
 
-def test_append_uses_max_used_row_across_landing_cols():
-    wb, ws = _fresh_ws()
+def test_append_uses_max_used_row_across_landing_cols(ws):
     ws["D5"] = "x"
     ws["E10"] = "y"
     ws["A100"] = "zzz"  # outside landing zone — must not affect result
@@ -261,8 +213,7 @@ def test_append_uses_max_used_row_across_landing_cols():
     assert plan.landing_rows == (11, 12)
 
 
-def test_append_skips_past_any_used_cells_in_landing_zone():
-    wb, ws = _fresh_ws()
+def test_append_skips_past_any_used_cells_in_landing_zone(ws):
     ws["D3"] = "x"
     ws["E4"] = "BLOCK"
 
@@ -273,18 +224,16 @@ def test_append_skips_past_any_used_cells_in_landing_zone():
     assert plan.start_row == 5
 
 
-def test_append_on_empty_sheet_starts_at_row_1():
-    ws = _ws()
+def test_append_on_empty_sheet_starts_at_row_1(ws):
     plan = build_plan(ws, [["a"]], "A", "")
     assert plan is not None
     assert plan.start_row == 1
 
 
-def test_append_outside_landing_zone_does_not_affect_row():
+def test_append_outside_landing_zone_does_not_affect_row(ws):
     """Data in col A must NOT affect append row for landing zone B:C."""
-    wb, ws = _fresh_ws()
     for i in range(1, 101):
-        ws[f"A{i}"] = f"noise_{i}"
+        ws.append([f"noise_{i}"])
 
     shaped = [["val1", "val2"]]
     plan = build_plan(ws, shaped, start_col_letters="B", start_row_str="")
@@ -292,13 +241,12 @@ def test_append_outside_landing_zone_does_not_affect_row():
     assert plan.start_row == 1
 
 
-def test_append_blocker_absorbed_into_scan_not_probe():
+def test_append_blocker_absorbed_into_scan_not_probe(ws):
     """
     DEST_BLOCKED in pure append mode is impossible by design:
     any occupied cell in the landing zone gets counted in the scan,
     which pushes start_row past it. The probe then lands in an empty zone.
     """
-    wb, ws = _fresh_ws()
     ws["A1"] = "existing"
     ws["A2"] = "existing2"
     ws["A3"] = "BLOCK"  # all 3 cells counted by scan → start_row=4
@@ -312,8 +260,7 @@ def test_append_blocker_absorbed_into_scan_not_probe():
 # CORE.PLANNER — build_plan explicit mode / collision
 # ══════════════════════════════════════════════════════════════════════════════
 
-def test_explicit_start_row_collision_probe_blocks():
-    wb, ws = _fresh_ws()
+def test_explicit_start_row_collision_probe_blocks(ws):
     ws["D50"] = "BLOCK"
 
     with pytest.raises(AppError) as ei:
@@ -323,29 +270,33 @@ def test_explicit_start_row_collision_probe_blocks():
     assert ei.value.details["target_start"] == "D50"
 
 
-def test_planner_start_row_zero_raises_bad_spec():
-    ws = _ws()
-    with pytest.raises(AppError) as ei:
-        build_plan(ws, [["a"]], "A", "0")
-    assert ei.value.code == BAD_SPEC
+def test_explicit_probe_reads_cell_store_without_iter_rows(ws, monkeypatch):
+    """Overlap probe on an in-memory sheet: dict lookups only, no phantom cells."""
+    for i in range(1, 10_001):
+        ws.append([f"noise_{i}"])
+    ws["B50"] = "below"     # target col used past the landing rows → probe runs
+    monkeypatch.setattr(ws, "iter_rows",
+                        lambda *a, **k: pytest.fail("build_plan scanned with iter_rows"))
+    n_cells = len(ws._cells)
 
+    plan = build_plan(ws, [["a", "b"]] * 3, start_col_letters="B", start_row_str="10")
+    assert plan.landing_rows == (10, 12)
+    assert len(ws._cells) == n_cells
 
-def test_planner_start_row_negative_raises_bad_spec():
-    ws = _ws()
     with pytest.raises(AppError) as ei:
-        build_plan(ws, [["a"]], "A", "-5")
-    assert ei.value.code == BAD_SPEC
+        build_plan(ws, [["a", "b"]], start_col_letters="B", start_row_str="50")
+    assert ei.value.details["first_blocker"]["value"] == "below"
+    assert len(ws._cells) == n_cells
 
 
-def test_planner_start_row_float_string_raises_bad_spec():
-    ws = _ws()
+@pytest.mark.parametrize("bad_row", ["0", "-5", "3.5"])
+def test_planner_bad_start_row_raises_bad_spec(bad_row, ws):
     with pytest.raises(AppError) as ei:
-        build_plan(ws, [["a"]], "A", "3.5")
+        build_plan(ws, [["a"]], "A", bad_row)
     assert ei.value.code == BAD_SPEC
 
 
-def test_planner_blocker_explicit_mode_details_flag_false():
-    ws = _ws()
+def test_planner_blocker_explicit_mode_details_flag_false(ws):
     ws["A5"] = "BLOCK"
     with pytest.raises(AppError) as ei:
         build_plan(ws, [["a"]], "A", "5")
@@ -353,14 +304,13 @@ def test_planner_blocker_explicit_mode_details_flag_false():
     assert ei.value.details["append_mode"] is False
 
 
-def test_planner_blocker_append_mode_details_flag_true():
+def test_planner_blocker_append_mode_details_flag_true(ws):
     """
     In append mode the scan covers ALL target columns, so any occupied cell
     is absorbed into the scan and pushes start_row past it.
     DEST_BLOCKED is therefore impossible in pure append mode (by design).
     Verify that a cell inside the landing zone does NOT raise.
     """
-    ws = _ws()
     ws["A1"] = "existing"
     ws["A2"] = "existing2"
     ws["B3"] = "BLOCKER_IN_B"   # scan sees this → max_used=3 → start_row=4
@@ -371,8 +321,7 @@ def test_planner_blocker_append_mode_details_flag_true():
     assert plan.start_row == 4                      # placed safely after B3
 
 
-def test_planner_blocker_details_contain_first_blocker_fields():
-    ws = _ws()
+def test_planner_blocker_details_contain_first_blocker_fields(ws):
     ws["C3"] = "blocked_value"
 
     with pytest.raises(AppError) as ei:
@@ -386,9 +335,8 @@ def test_planner_blocker_details_contain_first_blocker_fields():
     assert blocker["value"] == "blocked_value"
 
 
-def test_planner_collision_anywhere_in_bounding_box():
+def test_planner_collision_anywhere_in_bounding_box(ws):
     """Blocker not at top-left but inside the write rectangle still triggers DEST_BLOCKED."""
-    ws = _ws()
     ws["B2"] = "inner_block"
 
     with pytest.raises(AppError) as ei:
@@ -397,8 +345,36 @@ def test_planner_collision_anywhere_in_bounding_box():
     assert ei.value.code == DEST_BLOCKED
 
 
-def test_build_plan_returns_none_for_empty_shaped():
-    wb, ws = _fresh_ws()
+_FRESH_WB_PLAN_CASES = {
+    # start_col, start_row → planned start row, or the first blocker's cell
+    "append_B":   ("B", "",  5),
+    "append_D":   ("D", "",  5),
+    "explicit_A": ("A", "1", "A2"),
+    "explicit_B": ("B", "2", "D4"),
+    "explicit_E": ("E", "3", 3),
+}
+
+
+@pytest.mark.parametrize("start_col, start_row, expected", list(_FRESH_WB_PLAN_CASES.values()),
+                         ids=list(_FRESH_WB_PLAN_CASES))
+def test_build_plan_on_fresh_in_memory_workbook(start_col, start_row, expected):
+    """A plain Workbook().active plans with no file behind it; bare formulas are free."""
+    ws = Workbook().active
+    ws["D4"] = "HIDDEN_BLOCK"
+    ws["A2"] = "x"
+    ws["B6"] = "=SUM(A1:A5)"
+    shaped = [["a", None, "c"]] * 3
+
+    if isinstance(expected, int):
+        assert build_plan(ws, shaped, start_col, start_row).start_row == expected
+        return
+    with pytest.raises(AppError) as ei:
+        build_plan(ws, shaped, start_col, start_row)
+    blocker = ei.value.details["first_blocker"]
+    assert f"{blocker['col_letter']}{blocker['row']}" == expected
+
+
+def test_build_plan_returns_none_for_empty_shaped(ws):
     assert build_plan(ws, [], start_col_letters="A", start_row_str="") is None
     assert build_plan(ws, [[]], start_col_letters="A", start_row_str="") is None
 
@@ -407,8 +383,7 @@ def test_build_plan_returns_none_for_empty_shaped():
 # CORE.WRITER — apply_write_plan
 # ══════════════════════════════════════════════════════════════════════════════
 
-def test_writer_writes_exact_rectangle():
-    wb, ws = _fresh_ws()
+def test_writer_writes_exact_rectangle(ws):
     shaped = [["a", "b"], ["c", "d"]]
     plan = build_plan(ws, shaped, start_col_letters="C", start_row_str="")
     rows_written = apply_write_plan(ws, shaped, plan)
@@ -419,8 +394,7 @@ def test_writer_writes_exact_rectangle():
     assert ws["D2"].value == "d"
 
 
-def test_writer_appends_after_existing_data():
-    wb, ws = _fresh_ws()
+def test_writer_appends_after_existing_data(ws):
     ws["C1"] = "existing"
     ws["D3"] = "also existing"
 
@@ -432,8 +406,7 @@ def test_writer_appends_after_existing_data():
     assert ws["D4"].value == "y"
 
 
-def test_writer_writes_bool_values():
-    wb, ws = _fresh_ws()
+def test_writer_writes_bool_values(ws):
     shaped = [[True, False]]
     plan = build_plan(ws, shaped, "A", "")
     apply_write_plan(ws, shaped, plan)
@@ -441,17 +414,15 @@ def test_writer_writes_bool_values():
     assert ws["B1"].value is False
 
 
-def test_writer_writes_numeric_zero():
-    wb, ws = _fresh_ws()
+def test_writer_writes_numeric_zero(ws):
     shaped = [[0, 0.0]]
     plan = build_plan(ws, shaped, "A", "")
     apply_write_plan(ws, shaped, plan)
     assert ws["A1"].value == 0
 
 
-def test_writer_skips_none_values():
+def test_writer_skips_none_values(ws):
     """None cells must not be written (avoids openpyxl phantom cell registration)."""
-    wb, ws = _fresh_ws()
     shaped = [["data", None, "more"]]
     plan = build_plan(ws, shaped, "A", "")
     apply_write_plan(ws, shaped, plan)
@@ -460,13 +431,36 @@ def test_writer_skips_none_values():
     assert ws["C1"].value == "more"
 
 
+def test_writer_keeps_column_max_cache_current(ws):
+    """Back-to-back appends stack correctly off the cached column-max map."""
+    ws["B2"] = "seed"
+    for expected in (3, 5):
+        shaped = [["x", None], [None, "y"]]
+        plan = build_plan(ws, shaped, "B", "")
+        assert plan.start_row == expected
+        apply_write_plan(ws, shaped, plan)
+    assert ws["B5"].value == "x" and ws["C6"].value == "y"
+
+
+def test_append_plan_sees_cells_added_outside_writer(ws):
+    build_plan(ws, [["a"]], "A", "")        # primes the cache on an empty sheet
+    ws["A7"] = "late"
+    assert build_plan(ws, [["a"]], "A", "").start_row == 8
+
+
+def test_append_plan_does_not_materialise_cells(ws):
+    ws["A3"] = "x"
+    build_plan(ws, [["a", "b", "c"]], "A", "")
+    assert ws.max_row == 3 and ws.max_column == 1
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # CORE.TRANSFORM — apply_row_selection, apply_column_selection
 # ══════════════════════════════════════════════════════════════════════════════
 
 def test_apply_row_selection_empty_indices_returns_all():
     rows = [[1], [2], [3]]
-    assert apply_row_selection(rows, []) == rows
+    assert apply_row_selection(rows, []) is rows
 
 
 def test_apply_row_selection_selects_correct_rows():
@@ -476,13 +470,13 @@ def test_apply_row_selection_selects_correct_rows():
 
 def test_apply_row_selection_duplicate_indices_duplicates_rows():
     rows = [["a"], ["b"]]
-    result = apply_row_selection(rows, [0, 0, 1])
+    result = apply_row_selection(rows, [0, 0, 1, 7])
     assert result == [["a"], ["a"], ["b"]]
 
 
 def test_apply_column_selection_empty_indices_returns_all():
     rows = [[1, 2, 3]]
-    assert apply_column_selection(rows, []) == rows
+    assert apply_column_selection(rows, []) is rows
 
 
 def test_apply_column_selection_selects_correct_cols():
@@ -502,6 +496,22 @@ def test_apply_column_selection_out_of_range_fills_none():
     assert result == [["a", None]]
 
 
+def test_apply_column_selection_ragged_rows_pad_only_short_rows():
+    rows = [["a", "b", "c"], ["d"], ["e", "f", "g", "h"]]
+    assert apply_column_selection(rows, [2, 0]) == [["c", "a"], [None, "d"], ["g", "e"]]
+
+
+def test_row_col_selection_matches_numpy_gather():
+    """Bulk oracle: list-path selection equals numpy's np.ix_ gather."""
+    np = pytest.importorskip("numpy")
+    rows = [[f"r{r}c{c}" for c in range(120)] for r in range(2_000)]
+    grid = np.asarray(rows, dtype=object)
+    sel_r = list(range(0, 2_000, 7)) + [3, 3]
+    for sel_c in (list(range(0, 120, 3)), [119, 0, 0, 57], [42]):
+        expected = grid[np.ix_(sel_r, sel_c)].tolist()
+        assert apply_column_selection(apply_row_selection(rows, sel_r), sel_c) == expected
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # CORE.TRANSFORM — shape_pack, shape_keep
 # ══════════════════════════════════════════════════════════════════════════════
@@ -523,75 +533,124 @@ def test_shape_keep_empty_row_indices_uses_all_rows():
     assert result == original
 
 
-# ══════════════════════════════════════════════════════════════════════════════
-# CORE.PARSING
-# ══════════════════════════════════════════════════════════════════════════════
-
-def test_col_letters_to_index_single():
-    assert col_letters_to_index("A") == 1
-    assert col_letters_to_index("Z") == 26
-
-
-def test_col_letters_to_index_double():
-    assert col_letters_to_index("AA") == 27
-    assert col_letters_to_index("AZ") == 52
-
-
-def test_col_index_to_letters_single():
-    assert col_index_to_letters(1) == "A"
-    assert col_index_to_letters(26) == "Z"
-
-
-def test_col_index_to_letters_double():
-    assert col_index_to_letters(27) == "AA"
+def test_shape_keep_bounding_box_spans_selected_min_max():
+    original = [["a", "b", "c", "d", "e"],
+                ["f", "g", "h", "i", "j"],
+                ["k", "l", "m", "n", "o"]]
+    result = shape_keep(original, [2, 0, 9], [4, 2])
+    assert result == [["m", None, "o"],
+                      ["c", None, "e"]]
 
 
-def test_col_letters_roundtrip_boundaries():
-    boundaries = [1, 26, 27, 52, 53, 702, 703, 16384]
-    for n in boundaries:
-        letters = col_index_to_letters(n)
-        assert col_letters_to_index(letters) == n, f"Roundtrip failed at {n} → {letters}"
+def test_shape_keep_ragged_rows_pad_unselected_and_short_cells():
+    original = [["a", "b", "c", "d"], ["e"], ["f", "g", "h"]]
+    assert shape_keep(original, [0, 1, 2], [3, 1, 1]) == [["b", None, "d"],
+                                                          [None, None, None],
+                                                          ["g", None, None]]
 
 
-def test_col_letters_to_index_xfd():
-    assert col_letters_to_index("XFD") == 16384
-    assert col_index_to_letters(16384) == "XFD"
+def test_shape_keep_sparse_wide_selection_matches_numpy_block():
+    """Bulk oracle: 100 scattered cols over a 2k-wide box equal an np.ix_ block fill."""
+    np = pytest.importorskip("numpy")
+    rows = [[r * 2_000 + c for c in range(2_000)] for r in range(300)]
+    sel_r = list(range(0, 300, 3)) + [5, 5]
+    sel_c = list(range(1_980, -1, -20))
+    src_cols = sorted(sel_c)
+    expected = np.full((len(sel_r), src_cols[-1] - src_cols[0] + 1), None, dtype=object)
+    expected[:, [c - src_cols[0] for c in src_cols]] = np.asarray(rows)[np.ix_(sel_r, src_cols)]
+    assert shape_keep(rows, sel_r, sel_c) == expected.tolist()
 
 
-def test_parse_columns_single():
-    assert parse_columns("A") == [0]
-    assert parse_columns("Z") == [25]
-    assert parse_columns("AA") == [26]
-
+# ══════════════════════════════════════════════════════════════════════════════
+# CORE.PARSING
+# ══════════════════════════════════════════════════════════════════════════════
 
-def test_parse_columns_list():
-    assert parse_columns("A,C,E") == [0, 2, 4]
+@pytest.mark.parametrize("fn, spec, expected", [
+    (col_letters_to_index, "A",       1),
+    (col_letters_to_index, "Z",       26),
+    (col_letters_to_index, "AA",      27),
+    (col_letters_to_index, "AZ",      52),
+    (col_letters_to_index, "XFD",     16384),
+    (col_index_to_letters, 1,         "A"),
+    (col_index_to_letters, 26,        "Z"),
+    (col_index_to_letters, 27,        "AA"),
+    (col_index_to_letters, 16384,     "XFD"),
+    (parse_columns,        "A",       [0]),
+    (parse_columns,        "Z",       [25]),
+    (parse_columns,        "AA",      [26]),
+    (parse_columns,        "A,B,C,",  [0, 1, 2]),   # trailing comma ok
+    (parse_rows,           "1",       [0]),
+    (parse_rows,           "1000000", [999999]),
+], ids=lambda v: v.__name__ if callable(v) else repr(v))
+def test_parse_tokens(fn, spec, expected):
+    assert fn(spec) == expected
+
+
+def test_col_letters_roundtrip():
+    expected = list(range(1, 200)) + [702, 703, 16384]
+    got = [col_letters_to_index(col_index_to_letters(n)) for n in expected]
+    assert got == expected
+
+
+def test_col_letter_table_matches_openpyxl():
+    """The import-time A..ZZZ lookup table agrees with openpyxl everywhere."""
+    ns = range(1, 18279)
+    assert [col_index_to_letters(n) for n in ns] == [get_column_letter(n) for n in ns]
+    assert [col_letters_to_index(get_column_letter(n)) for n in ns] == list(ns)
+    assert col_index_to_letters(18279) == "AAAA"            # past the table
+    assert col_letters_to_index("aaaa") == 18279
+
+
+@pytest.mark.parametrize("fn, spec, expected", [
+    (parse_columns, "A,C,E", [0, 2, 4]),
+    (parse_columns, "C,A",   [0, 2]),
+    (parse_columns, "A-C",   [0, 1, 2]),
+    (parse_columns, "C-A",   [0, 1, 2]),
+    (parse_rows,    "1-3",   [0, 1, 2]),
+    (parse_rows,    "3-1",   [0, 1, 2]),
+    (parse_rows,    "1,3,5", [0, 2, 4]),
+    (parse_rows,    "9-12,1-3,3-5,10,4", [0, 1, 2, 3, 4, 8, 9, 10, 11]),
+    (parse_rows,    "5-6,1-9,2", list(range(9))),
+    (parse_columns, "E-F,B,A-B,F", [0, 1, 4, 5]),
+], ids=lambda v: v.__name__ if callable(v) else repr(v))
+def test_parse_specs(fn, spec, expected):
+    assert fn(spec) == expected
+
+
+@pytest.mark.parametrize("fn, bad", [
+    (col_letters_to_index, "A1"),
+    (col_letters_to_index, ""),
+    (col_index_to_letters, 0),
+])
+def test_col_conversion_bad_input_keeps_raising(fn, bad):
+    """A bad input raises BAD_SPEC on every call, not just the first."""
+    for _ in range(2):
+        with pytest.raises(AppError) as ei:
+            fn(bad)
+        assert ei.value.code == BAD_SPEC
+
+
+@pytest.mark.parametrize("fn, spec, message", [
+    (parse_columns, "A, B C ,D", "Bad column token: ' B C '"),
+    (parse_columns, "A,,1",      "Bad column token: '1'"),
+    (parse_rows,    "1-2,3-,4",  "Bad row token: '3-'"),
+    (parse_rows,    " 2 , 0-4",  "Row numbers must be >= 1: '0-4'"),
+], ids=lambda v: v.__name__ if callable(v) else repr(v))
+def test_parse_specs_name_the_offending_token(fn, spec, message):
+    with pytest.raises(AppError) as ei:
+        fn(spec)
+    assert ei.value.code == BAD_SPEC
+    assert ei.value.message == message
 
 
-def test_parse_columns_range():
+def test_parse_results_are_fresh_lists_despite_cache():
+    """Specs are memoised; mutating a returned list must not leak into the cache."""
+    cols = parse_columns("A-C")
+    cols.append(99)
+    rows = parse_rows("1-2")
+    rows.clear()
     assert parse_columns("A-C") == [0, 1, 2]
-
-
-def test_parse_columns_trailing_comma_ok():
-    result = parse_columns("A,B,C,")
-    assert result == [0, 1, 2]
-
-
-def test_parse_rows_single():
-    assert parse_rows("1") == [0]
-
-
-def test_parse_rows_range():
-    assert parse_rows("1-3") == [0, 1, 2]
-
-
-def test_parse_rows_list():
-    assert parse_rows("1,3,5") == [0, 2, 4]
-
-
-def test_parse_rows_very_large_row_number():
-    result = parse_rows("1000000")
-    assert result == [999999]
+    assert parse_rows("1-2") == [0, 1]
 
 
 # ══════════════════════════════════════════════════════════════════════════════
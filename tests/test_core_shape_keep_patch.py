@@ -35,18 +35,6 @@ def test_shape_keep_preserves_col_gaps_compresses_rows():
     assert result[1][2] == "C3"
 
 
-def test_shape_keep_empty_col_indices_uses_all_cols():
-    original = [["a", "b", "c"], ["d", "e", "f"]]
-    result = shape_keep(original, [0, 1], [])
-    assert result == original
-
-
-def test_shape_keep_empty_row_indices_uses_all_rows():
-    original = [["a", "b"], ["c", "d"]]
-    result = shape_keep(original, [], [0, 1])
-    assert result == original
-
-
 def test_shape_keep_row_count_equals_selected_rows():
     """
     Keep Format output height = number of selected rows (not bounding box height).
@@ -28,66 +28,17 @@ Section 5: Full pipeline combo
 """
 from __future__ import annotations
 
-import csv
-import os
-from tempfile import TemporaryDirectory
-
-import pytest
-from openpyxl import Workbook, load_workbook
-
 from core.batch import run_all
-from core.errors import AppError
-from core.models import Destination, Rule, SheetConfig
+from core.models import Rule
 from core.rules import apply_rules
 from core.runner import run_sheet
+from tests.helpers import make_cfg, sheet_cells, write_csv, write_xlsx
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 # HELPERS
 # ══════════════════════════════════════════════════════════════════════════════
 
-def _xlsx(path, data, sheet="Sheet1"):
-    wb = Workbook()
-    ws = wb.active
-    ws.title = sheet
-    for r, row in enumerate(data, 1):
-        for c, v in enumerate(row, 1):
-            ws.cell(row=r, column=c, value=v)
-    wb.save(path)
-    return path
-
-
-def _csv(path, data):
-    with open(path, "w", newline="", encoding="utf-8") as f:
-        csv.writer(f).writerows(data)
-    return path
-
-
-def _cfg(dest_path, *, columns="", rows="", mode="pack", rules=None,
-         combine="AND", start_col="A", start_row="", dest_sheet="Out",
-         src_sheet="Sheet1", src_start_row=""):
-    return SheetConfig(
-        name=src_sheet,
-        workbook_sheet=src_sheet,
-        source_start_row=src_start_row,
-        columns_spec=columns,
-        rows_spec=rows,
-        paste_mode=mode,
-        rules_combine=combine,
-        rules=rules or [],
-        destination=Destination(
-            file_path=dest_path,
-            sheet_name=dest_sheet,
-            start_col=start_col,
-            start_row=start_row,
-        ),
-    )
-
-
-def _ws(path, sheet="Out"):
-    return load_workbook(path)[sheet]
-
-
 def _rule(op, val, col="A", mode="include"):
     return Rule(mode=mode, column=col, operator=op, value=val)
 
@@ -190,7 +141,7 @@ class TestRulesEdgeCases:
 
 class TestKeepModeRulesCombos:
 
-    def test_keep_mode_rules_filter_all_rows_falls_back_to_all(self):
+    def test_keep_mode_rules_filter_all_rows_falls_back_to_all(self, tmp_path):
         """
         Keep mode: when rules filter out every row, survived_abs_indices is
         empty. shape_keep treats empty row indices as 'all rows' (by design —
@@ -198,65 +149,55 @@ class TestKeepModeRulesCombos:
         pack mode where filtered_rows being empty produces zero output.
         Verify the keep-mode behavior is stable.
         """
-        with TemporaryDirectory() as td:
-            src = _xlsx(os.path.join(td, "s.xlsx"),
-                        [["alpha", 1], ["beta", 2], ["gamma", 3]])
-            dest = os.path.join(td, "d.xlsx")
-            r = run_sheet(src, _cfg(dest, columns="A,B", mode="keep", rules=[
-                Rule(mode="include", column="A", operator="equals", value="NOMATCH")
-            ]))
-            # Keep mode: empty survived indices → shape_keep uses all rows
-            assert r.rows_written == 3
-
-    def test_pack_mode_rules_filter_all_rows_zero_output(self):
+        src = write_xlsx(str(tmp_path / "s.xlsx"),
+                         [["alpha", 1], ["beta", 2], ["gamma", 3]])
+        dest = str(tmp_path / "d.xlsx")
+        r = run_sheet(src, make_cfg(dest, columns="A,B", mode="keep", rules=[
+            Rule(mode="include", column="A", operator="equals", value="NOMATCH")
+        ]))
+        # Keep mode: empty survived indices → shape_keep uses all rows
+        assert r.rows_written == 3
+
+    def test_pack_mode_rules_filter_all_rows_zero_output(self, tmp_path):
         """Pack mode: when rules filter out every row → zero rows written."""
-        with TemporaryDirectory() as td:
-            src = _xlsx(os.path.join(td, "s.xlsx"),
-                        [["alpha", 1], ["beta", 2], ["gamma", 3]])
-            dest = os.path.join(td, "d.xlsx")
-            r = run_sheet(src, _cfg(dest, columns="A,B", mode="pack", rules=[
-                Rule(mode="include", column="A", operator="equals", value="NOMATCH")
-            ]))
-            assert r.rows_written == 0
-
-    def test_keep_mode_single_surviving_row_wide_gap(self):
+        src = write_xlsx(str(tmp_path / "s.xlsx"),
+                         [["alpha", 1], ["beta", 2], ["gamma", 3]])
+        dest = str(tmp_path / "d.xlsx")
+        r = run_sheet(src, make_cfg(dest, columns="A,B", mode="pack", rules=[
+            Rule(mode="include", column="A", operator="equals", value="NOMATCH")
+        ]))
+        assert r.rows_written == 0
+
+    def test_keep_mode_single_surviving_row_wide_gap(self, tmp_path):
         """Keep mode: one row survives rules, cols A and E selected → wide gap output."""
-        with TemporaryDirectory() as td:
-            src = _xlsx(os.path.join(td, "s.xlsx"),
-                        [["keep", "b", "c", "d", "e_val"],
-                         ["drop", "b", "c", "d", "e_val2"],
-                         ["drop", "b", "c", "d", "e_val3"]])
-            dest = os.path.join(td, "d.xlsx")
-            r = run_sheet(src, _cfg(dest, columns="A,E", mode="keep", rules=[
-                Rule(mode="include", column="A", operator="equals", value="keep")
-            ]))
-            assert r.rows_written == 1
-            ws = _ws(dest)
-            assert ws["A1"].value == "keep"
-            assert ws["B1"].value is None  # gap
-            assert ws["C1"].value is None  # gap
-            assert ws["D1"].value is None  # gap
-            assert ws["E1"].value == "e_val"
-
-    def test_keep_mode_rules_exclude_middle_rows_only(self):
+        src = write_xlsx(str(tmp_path / "s.xlsx"),
+                         [["keep", "b", "c", "d", "e_val"],
+                          ["drop", "b", "c", "d", "e_val2"],
+                          ["drop", "b", "c", "d", "e_val3"]])
+        dest = str(tmp_path / "d.xlsx")
+        r = run_sheet(src, make_cfg(dest, columns="A,E", mode="keep", rules=[
+            Rule(mode="include", column="A", operator="equals", value="keep")
+        ]))
+        assert r.rows_written == 1
+        snap = sheet_cells(dest)
+        # B1, C1, D1: gap
+        assert snap == {"A1": "keep", "E1": "e_val"}
+
+    def test_keep_mode_rules_exclude_middle_rows_only(self, tmp_path):
         """Keep mode: first and last rows survive, middle excluded — compressed output."""
-        with TemporaryDirectory() as td:
-            src = _xlsx(os.path.join(td, "s.xlsx"),
-                        [["keep", 1, "x"],
-                         ["drop", 2, "y"],
-                         ["drop", 3, "z"],
-                         ["keep", 4, "w"]])
-            dest = os.path.join(td, "d.xlsx")
-            r = run_sheet(src, _cfg(dest, columns="A,C", mode="keep", rules=[
-                Rule(mode="include", column="A", operator="equals", value="keep")
-            ]))
-            assert r.rows_written == 2
-            ws = _ws(dest)
-            assert ws["A1"].value == "keep"
-            assert ws["C1"].value == "x"
-            assert ws["A2"].value == "keep"
-            assert ws["C2"].value == "w"
-            assert ws["A3"].value is None  # nothing beyond 2 rows
+        src = write_xlsx(str(tmp_path / "s.xlsx"),
+                         [["keep", 1, "x"],
+                          ["drop", 2, "y"],
+                          ["drop", 3, "z"],
+                          ["keep", 4, "w"]])
+        dest = str(tmp_path / "d.xlsx")
+        r = run_sheet(src, make_cfg(dest, columns="A,C", mode="keep", rules=[
+            Rule(mode="include", column="A", operator="equals", value="keep")
+        ]))
+        assert r.rows_written == 2
+        snap = sheet_cells(dest)
+        # A3: nothing beyond 2 rows
+        assert snap == {"A1": "keep", "C1": "x", "A2": "keep", "C2": "w"}
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -265,88 +206,77 @@ class TestKeepModeRulesCombos:
 
 class TestBatchEdgeCases:
 
-    def test_two_sources_same_dest_different_start_cols_merge(self):
+    def test_two_sources_same_dest_different_start_cols_merge(self, tmp_path):
         """Two sources writing to non-overlapping start_cols on the same row."""
-        with TemporaryDirectory() as td:
-            dest = os.path.join(td, "d.xlsx")
-            s1 = _xlsx(os.path.join(td, "s1.xlsx"), [["left1"], ["left2"]])
-            s2 = _xlsx(os.path.join(td, "s2.xlsx"), [["right1"], ["right2"]])
-            report = run_all([
-                (s1, "R1", _cfg(dest, start_col="A", start_row="1")),
-                (s2, "R2", _cfg(dest, start_col="D", start_row="1")),
-            ])
-            assert report.ok
-            ws = _ws(dest)
-            assert ws["A1"].value == "left1"
-            assert ws["A2"].value == "left2"
-            assert ws["D1"].value == "right1"
-            assert ws["D2"].value == "right2"
-            assert ws["B1"].value is None
-            assert ws["C1"].value is None
-
-    def test_batch_zero_rows_then_normal_append_correct(self):
+        dest = str(tmp_path / "d.xlsx")
+        s1 = write_xlsx(str(tmp_path / "s1.xlsx"), [["left1"], ["left2"]])
+        s2 = write_xlsx(str(tmp_path / "s2.xlsx"), [["right1"], ["right2"]])
+        report = run_all([
+            (s1, "R1", make_cfg(dest, start_col="A", start_row="1")),
+            (s2, "R2", make_cfg(dest, start_col="D", start_row="1")),
+        ])
+        assert report.ok
+        snap = sheet_cells(dest)
+        assert snap == {"A1": "left1", "D1": "right1", "A2": "left2", "D2": "right2"}
+
+    def test_batch_zero_rows_then_normal_append_correct(self, tmp_path):
         """First item filters to zero rows; second item should still land at row 1."""
-        with TemporaryDirectory() as td:
-            dest = os.path.join(td, "d.xlsx")
-            s1 = _xlsx(os.path.join(td, "s1.xlsx"),
-                        [["alpha", 1], ["beta", 2]])
-            s2 = _xlsx(os.path.join(td, "s2.xlsx"),
-                        [["data", 99]])
-            report = run_all([
-                (s1, "R1", _cfg(dest, rules=[
-                    Rule(mode="include", column="A", operator="equals", value="NOMATCH")
-                ])),
-                (s2, "R2", _cfg(dest)),
-            ])
-            assert report.ok
-            assert report.results[0].rows_written == 0
-            assert report.results[1].rows_written == 1
-            ws = _ws(dest)
-            assert ws["A1"].value == "data"
-            assert ws["B1"].value == 99
-
-    def test_batch_zero_normal_zero_middle_lands_correctly(self):
+        dest = str(tmp_path / "d.xlsx")
+        s1 = write_xlsx(str(tmp_path / "s1.xlsx"),
+                         [["alpha", 1], ["beta", 2]])
+        s2 = write_xlsx(str(tmp_path / "s2.xlsx"),
+                         [["data", 99]])
+        report = run_all([
+            (s1, "R1", make_cfg(dest, rules=[
+                Rule(mode="include", column="A", operator="equals", value="NOMATCH")
+            ])),
+            (s2, "R2", make_cfg(dest)),
+        ])
+        assert report.ok
+        assert report.results[0].rows_written == 0
+        assert report.results[1].rows_written == 1
+        snap = sheet_cells(dest)
+        assert snap.get("A1") == "data"
+        assert snap.get("B1") == 99
+
+    def test_batch_zero_normal_zero_middle_lands_correctly(self, tmp_path):
         """Zero-row, normal, zero-row — middle item lands at row 1."""
-        with TemporaryDirectory() as td:
-            dest = os.path.join(td, "d.xlsx")
-            s1 = _xlsx(os.path.join(td, "s1.xlsx"), [["x"]])
-            s2 = _xlsx(os.path.join(td, "s2.xlsx"), [["real_data"]])
-            s3 = _xlsx(os.path.join(td, "s3.xlsx"), [["y"]])
-            no_match_rule = [Rule(mode="include", column="A",
-                                  operator="equals", value="NOMATCH")]
-            report = run_all([
-                (s1, "R1", _cfg(dest, rules=no_match_rule)),
-                (s2, "R2", _cfg(dest)),
-                (s3, "R3", _cfg(dest, rules=no_match_rule)),
-            ])
-            assert report.ok
-            assert report.results[0].rows_written == 0
-            assert report.results[1].rows_written == 1
-            assert report.results[2].rows_written == 0
-            ws = _ws(dest)
-            assert ws["A1"].value == "real_data"
-            assert ws["A2"].value is None
-
-    def test_batch_two_normal_then_zero_row_no_corruption(self):
+        dest = str(tmp_path / "d.xlsx")
+        s1 = write_xlsx(str(tmp_path / "s1.xlsx"), [["x"]])
+        s2 = write_xlsx(str(tmp_path / "s2.xlsx"), [["real_data"]])
+        s3 = write_xlsx(str(tmp_path / "s3.xlsx"), [["y"]])
+        no_match_rule = [Rule(mode="include", column="A",
+                              operator="equals", value="NOMATCH")]
+        report = run_all([
+            (s1, "R1", make_cfg(dest, rules=no_match_rule)),
+            (s2, "R2", make_cfg(dest)),
+            (s3, "R3", make_cfg(dest, rules=no_match_rule)),
+        ])
+        assert report.ok
+        assert report.results[0].rows_written == 0
+        assert report.results[1].rows_written == 1
+        assert report.results[2].rows_written == 0
+        snap = sheet_cells(dest)
+        assert snap.get("A1") == "real_data"
+        assert snap.get("A2") is None
+
+    def test_batch_two_normal_then_zero_row_no_corruption(self, tmp_path):
         """Two normal appends then a zero-row item — first two stack, third is harmless."""
-        with TemporaryDirectory() as td:
-            dest = os.path.join(td, "d.xlsx")
-            s1 = _xlsx(os.path.join(td, "s1.xlsx"), [["first"]])
-            s2 = _xlsx(os.path.join(td, "s2.xlsx"), [["second"]])
-            s3 = _xlsx(os.path.join(td, "s3.xlsx"), [["nope"]])
-            report = run_all([
-                (s1, "R1", _cfg(dest)),
-                (s2, "R2", _cfg(dest)),
-                (s3, "R3", _cfg(dest, rules=[
-                    Rule(mode="include", column="A",
-                         operator="equals", value="NOMATCH")
-                ])),
-            ])
-            assert report.ok
-            ws = _ws(dest)
-            assert ws["A1"].value == "first"
-            assert ws["A2"].value == "second"
-            assert ws["A3"].value is None
+        dest = str(tmp_path / "d.xlsx")
+        s1 = write_xlsx(str(tmp_path / "s1.xlsx"), [["first"]])
+        s2 = write_xlsx(str(tmp_path / "s2.xlsx"), [["second"]])
+        s3 = write_xlsx(str(tmp_path / "s3.xlsx"), [["nope"]])
+        report = run_all([
+            (s1, "R1", make_cfg(dest)),
+            (s2, "R2", make_cfg(dest)),
+            (s3, "R3", make_cfg(dest, rules=[
+                Rule(mode="include", column="A",
+                     operator="equals", value="NOMATCH")
+            ])),
+        ])
+        assert report.ok
+        snap = sheet_cells(dest)
+        assert snap == {"A1": "first", "A2": "second"}
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -355,40 +285,27 @@ class TestBatchEdgeCases:
 
 class TestDestinationManagement:
 
-    def test_dest_exists_no_default_sheet_name(self):
+    def test_dest_exists_no_default_sheet_name(self, tmp_path):
         """Dest file has only 'Data' sheet (no 'Sheet') — new sheet created, 'Data' preserved."""
-        with TemporaryDirectory() as td:
-            dest = os.path.join(td, "d.xlsx")
-            wb = Workbook()
-            wb.active.title = "Data"
-            wb["Data"]["A1"] = "existing"
-            wb.save(dest)
-
-            src = _xlsx(os.path.join(td, "s.xlsx"), [["new_val"]])
-            r = run_sheet(src, _cfg(dest, dest_sheet="Out"))
-            assert r.rows_written == 1
-            wb2 = load_workbook(dest)
-            assert "Data" in wb2.sheetnames
-            assert wb2["Data"]["A1"].value == "existing"
-            assert wb2["Out"]["A1"].value == "new_val"
-
-    def test_dest_exists_writing_to_existing_custom_sheet(self):
+        dest = str(tmp_path / "d.xlsx")
+        write_xlsx(dest, [["existing"]], sheet="Data")
+
+        src = write_xlsx(str(tmp_path / "s.xlsx"), [["new_val"]])
+        r = run_sheet(src, make_cfg(dest, dest_sheet="Out"))
+        assert r.rows_written == 1
+        assert sheet_cells(dest, "Data") == {"A1": "existing"}
+        assert sheet_cells(dest, "Out") == {"A1": "new_val"}
+
+    def test_dest_exists_writing_to_existing_custom_sheet(self, tmp_path):
         """Dest has 'Report' sheet with data — writing appends without clobbering."""
-        with TemporaryDirectory() as td:
-            dest = os.path.join(td, "d.xlsx")
-            wb = Workbook()
-            wb.active.title = "Report"
-            wb["Report"]["A1"] = "header"
-            wb["Report"]["A2"] = "old_data"
-            wb.save(dest)
-
-            src = _xlsx(os.path.join(td, "s.xlsx"), [["new_data"]])
-            r = run_sheet(src, _cfg(dest, dest_sheet="Report"))
-            assert r.rows_written == 1
-            ws = _ws(dest, "Report")
-            assert ws["A1"].value == "header"
-            assert ws["A2"].value == "old_data"
-            assert ws["A3"].value == "new_data"
+        dest = str(tmp_path / "d.xlsx")
+        write_xlsx(dest, [["header"], ["old_data"]], sheet="Report")
+
+        src = write_xlsx(str(tmp_path / "s.xlsx"), [["new_data"]])
+        r = run_sheet(src, make_cfg(dest, dest_sheet="Report"))
+        assert r.rows_written == 1
+        snap = sheet_cells(dest, "Report")
+        assert snap == {"A1": "header", "A2": "old_data", "A3": "new_data"}
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -397,105 +314,88 @@ class TestDestinationManagement:
 
 class TestFullPipelineCombos:
 
-    def test_source_start_row_rules_keep_mode_non_adjacent_cols(self):
+    def test_source_start_row_rules_keep_mode_non_adjacent_cols(self, tmp_path):
         """
         Full pipeline: source_start_row=2 skips header, rules filter on col B,
         keep mode with cols A,D selected — non-adjacent gaps preserved.
         """
-        with TemporaryDirectory() as td:
-            src = _xlsx(os.path.join(td, "s.xlsx"),
-                        [["HEADER", "FILTER", "X", "DATA"],   # row 1: skipped
-                         ["r2a",    "yes",    "x", "r2d"],     # row 2: kept
-                         ["r3a",    "no",     "x", "r3d"],     # row 3: filtered out
-                         ["r4a",    "yes",    "x", "r4d"],     # row 4: kept
-                         ["r5a",    "no",     "x", "r5d"]])    # row 5: filtered out
-            dest = os.path.join(td, "d.xlsx")
-            r = run_sheet(src, _cfg(dest,
+        src = write_xlsx(str(tmp_path / "s.xlsx"),
+                         [["HEADER", "FILTER", "X", "DATA"],   # row 1: skipped
+                          ["r2a",    "yes",    "x", "r2d"],     # row 2: kept
+                          ["r3a",    "no",     "x", "r3d"],     # row 3: filtered out
+                          ["r4a",    "yes",    "x", "r4d"],     # row 4: kept
+                          ["r5a",    "no",     "x", "r5d"]])    # row 5: filtered out
+        dest = str(tmp_path / "d.xlsx")
+        r = run_sheet(src, make_cfg(dest,
                                     src_start_row="2",
                                     columns="A,D",
                                     mode="keep",
                                     rules=[Rule(mode="include", column="B",
                                                 operator="equals", value="yes")]))
-            assert r.rows_written == 2
-            ws = _ws(dest)
-            # Keep mode: cols A-D bounding box, B and C are gaps
-            assert ws["A1"].value == "r2a"
-            assert ws["B1"].value is None  # gap
-            assert ws["C1"].value is None  # gap
-            assert ws["D1"].value == "r2d"
-            assert ws["A2"].value == "r4a"
-            assert ws["D2"].value == "r4d"
-            assert ws["A3"].value is None  # only 2 rows
-
-    def test_source_start_row_rules_pack_mode_row_selection(self):
+        assert r.rows_written == 2
+        snap = sheet_cells(dest)
+        # Keep mode: cols A-D bounding box, B and C are gaps
+        # B1, C1: gap; A3: only 2 rows
+        assert snap == {"A1": "r2a", "D1": "r2d", "A2": "r4a", "D2": "r4d"}
+
+    def test_source_start_row_rules_pack_mode_row_selection(self, tmp_path):
         """
         source_start_row=2, rows=1-3 (relative to offset table), rules filter,
         pack mode, column subset.
         """
-        with TemporaryDirectory() as td:
-            src = _xlsx(os.path.join(td, "s.xlsx"),
-                        [["SKIP",   "header"],       # row 1: skipped by start_row
-                         ["keep",   "val1",  "x1"],  # row 2 → offset row 1: selected, kept
-                         ["drop",   "val2",  "x2"],  # row 3 → offset row 2: selected, filtered
-                         ["keep",   "val3",  "x3"],  # row 4 → offset row 3: selected, kept
-                         ["keep",   "val4",  "x4"]]) # row 5 → offset row 4: NOT selected
-            dest = os.path.join(td, "d.xlsx")
-            r = run_sheet(src, _cfg(dest,
+        src = write_xlsx(str(tmp_path / "s.xlsx"),
+                         [["SKIP",   "header"],       # row 1: skipped by start_row
+                          ["keep",   "val1",  "x1"],  # row 2 → offset row 1: selected, kept
+                          ["drop",   "val2",  "x2"],  # row 3 → offset row 2: selected, filtered
+                          ["keep",   "val3",  "x3"],  # row 4 → offset row 3: selected, kept
+                          ["keep",   "val4",  "x4"]]) # row 5 → offset row 4: NOT selected
+        dest = str(tmp_path / "d.xlsx")
+        r = run_sheet(src, make_cfg(dest,
                                     src_start_row="2",
                                     rows="1-3",
                                     columns="A,C",
                                     mode="pack",
                                     rules=[Rule(mode="include", column="A",
                                                 operator="equals", value="keep")]))
-            assert r.rows_written == 2
-            ws = _ws(dest)
-            assert ws["A1"].value == "keep"
-            assert ws["B1"].value == "x1"  # col C packed to output B
-            assert ws["A2"].value == "keep"
-            assert ws["B2"].value == "x3"
-
-    def test_csv_source_start_row_rules_keep_mode(self):
+        assert r.rows_written == 2
+        snap = sheet_cells(dest)
+        # B1: col C packed to output B
+        assert snap == {"A1": "keep", "B1": "x1", "A2": "keep", "B2": "x3"}
+
+    def test_csv_source_start_row_rules_keep_mode(self, tmp_path):
         """Same full pipeline combo but with CSV source."""
-        with TemporaryDirectory() as td:
-            src = _csv(os.path.join(td, "s.csv"),
-                       [["HEADER", "FILTER", "DATA"],
-                        ["r2a",    "yes",    "r2c"],
-                        ["r3a",    "no",     "r3c"],
-                        ["r4a",    "yes",    "r4c"]])
-            dest = os.path.join(td, "d.xlsx")
-            r = run_sheet(src, _cfg(dest,
+        src = write_csv(str(tmp_path / "s.csv"),
+                        [["HEADER", "FILTER", "DATA"],
+                         ["r2a",    "yes",    "r2c"],
+                         ["r3a",    "no",     "r3c"],
+                         ["r4a",    "yes",    "r4c"]])
+        dest = str(tmp_path / "d.xlsx")
+        r = run_sheet(src, make_cfg(dest,
                                     src_start_row="2",
                                     columns="A,C",
                                     mode="keep",
                                     rules=[Rule(mode="include", column="B",
                                                 operator="equals", value="yes")]))
-            assert r.rows_written == 2
-            ws = _ws(dest)
-            assert ws["A1"].value == "r2a"
-            assert ws["B1"].value is None  # gap
-            assert ws["C1"].value == "r2c"
-            assert ws["A2"].value == "r4a"
-            assert ws["C2"].value == "r4c"
-
-    def test_full_pipeline_explicit_start_row_and_col_with_rules(self):
+        assert r.rows_written == 2
+        snap = sheet_cells(dest)
+        # B1: gap
+        assert snap == {"A1": "r2a", "C1": "r2c", "A2": "r4a", "C2": "r4c"}
+
+    def test_full_pipeline_explicit_start_row_and_col_with_rules(self, tmp_path):
         """Rules + column subset + explicit dest start_row=5 and start_col=C."""
-        with TemporaryDirectory() as td:
-            src = _xlsx(os.path.join(td, "s.xlsx"),
-                        [["yes", 10, "a"],
-                         ["no",  20, "b"],
-                         ["yes", 30, "c"]])
-            dest = os.path.join(td, "d.xlsx")
-            r = run_sheet(src, _cfg(dest,
+        src = write_xlsx(str(tmp_path / "s.xlsx"),
+                         [["yes", 10, "a"],
+                          ["no",  20, "b"],
+                          ["yes", 30, "c"]])
+        dest = str(tmp_path / "d.xlsx")
+        r = run_sheet(src, make_cfg(dest,
                                     columns="A,C",
                                     start_col="C",
                                     start_row="5",
                                     rules=[Rule(mode="include", column="A",
                                                 operator="equals", value="yes")]))
-            assert r.rows_written == 2
-            ws = _ws(dest)
-            assert ws["C5"].value == "yes"
-            assert ws["D5"].value == "a"
-            assert ws["C6"].value == "yes"
-            assert ws["D6"].value == "c"
-            # Nothing above row 5
-            assert ws["C4"].value is None
+        assert r.rows_written == 2
+        snap = sheet_cells(dest)
+        assert snap == {"C5": "yes", "D5": "a", "C6": "yes", "D6": "c"}
+        # Nothing above row 5
+        assert snap.get("C4") is None
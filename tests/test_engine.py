@@ -10,25 +10,9 @@ Full coverage lives in:
 """
 from __future__ import annotations
 
-import os
-from tempfile import TemporaryDirectory
-
-from openpyxl import Workbook
-
 from core.engine import run_sheet, run_all, RunItem
 from core.models import Destination, SheetConfig
-
-
-def _make_xlsx(path, data=None):
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Sheet1"
-    if data:
-        for r, row in enumerate(data, 1):
-            for c, v in enumerate(row, 1):
-                ws.cell(row=r, column=c, value=v)
-    wb.save(path)
-    return path
+from tests.helpers import write_xlsx
 
 
 def _cfg(dest):
@@ -39,23 +23,21 @@ def _cfg(dest):
     )
 
 
-def test_engine_run_sheet_shim():
+def test_engine_run_sheet_shim(tmp_path):
     """run_sheet imported from core.engine delegates to core.runner correctly."""
-    with TemporaryDirectory() as td:
-        src  = _make_xlsx(os.path.join(td, "src.xlsx"), data=[["hello"]])
-        dest = os.path.join(td, "dest.xlsx")
-        result = run_sheet(src, _cfg(dest))
-        assert result.rows_written == 1
+    src  = write_xlsx(str(tmp_path / "src.xlsx"), data=[["hello"]])
+    dest = str(tmp_path / "dest.xlsx")
+    result = run_sheet(src, _cfg(dest))
+    assert result.rows_written == 1
 
 
-def test_engine_run_all_shim():
+def test_engine_run_all_shim(tmp_path):
     """run_all imported from core.engine delegates to core.batch correctly."""
-    with TemporaryDirectory() as td:
-        src  = _make_xlsx(os.path.join(td, "src.xlsx"), data=[["world"]])
-        dest = os.path.join(td, "dest.xlsx")
-        report = run_all([(src, "R1", _cfg(dest))])
-        assert report.ok
-        assert report.results[0].rows_written == 1
+    src  = write_xlsx(str(tmp_path / "src.xlsx"), data=[["world"]])
+    dest = str(tmp_path / "dest.xlsx")
+    report = run_all([(src, "R1", _cfg(dest))])
+    assert report.ok
+    assert report.results[0].rows_written == 1
 
 
 def test_engine_run_item_type_alias_importable():
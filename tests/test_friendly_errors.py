@@ -6,8 +6,6 @@ with no raw tracebacks or code gibberish.
 """
 from __future__ import annotations
 
-import pytest
-
 from core.errors import (
     AppError,
     friendly_message,
@@ -25,6 +25,7 @@ from __future__ import annotations
 
 import json
 import os
+from pathlib import Path
 
 import pytest
 
@@ -43,16 +44,85 @@ except Exception:
 # widget creation but not during the bare tk.Tk() call.
 # ─────────────────────────────────────────────────────────────────────────────
 
+import core.autosave as autosave
 import gui.app as app
 from core.autosave import save_project_atomic
-from core.models import Destination, Rule, SheetConfig, SheetResult, RunReport
+from core.models import Destination, SheetConfig, SheetResult, RunReport
 from core.project import ProjectConfig, RecipeConfig, SourceConfig
 
 
+# Module-scoped fixtures: keep this file on one xdist worker (--dist=loadgroup)
+pytestmark = pytest.mark.xdist_group("gui")
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # HELPERS
 # ══════════════════════════════════════════════════════════════════════════════
 
+@pytest.fixture(autouse=True)
+def _isolated_autosave(tmp_path, monkeypatch):
+    """
+    Point autosave at a per-test file so no test (or pytest-xdist worker)
+    ever touches the shared ~/.turbo_extractor_v3/autosave.json.
+    Tests that need a specific path override the env var themselves.
+    """
+    monkeypatch.setenv("TURBO_AUTOSAVE_PATH", str(tmp_path / "autosave.json"))
+
+
+@pytest.fixture(scope="module")
+def gui_app(tmp_path_factory):
+    """
+    One TurboExtractorApp shared by the read-mostly tests in this module.
+    Tk root construction dominates these tests, so it is paid once; the
+    per-test fixtures below reset the model and tree before each use.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("TURBO_AUTOSAVE_PATH",
+                  str(tmp_path_factory.mktemp("gui_app") / "autosave.json"))
+        gui = app.TurboExtractorApp()
+    yield gui
+    gui.destroy()
+
+
+def _reset_gui(gui, project: ProjectConfig):
+    """Return the shared app to a just-constructed state around *project*."""
+    dialog = getattr(gui, "_report_dialog", None)
+    if dialog is not None:
+        if dialog.winfo_exists():
+            dialog.destroy()
+        gui._report_dialog = None
+    gui._cancel_autosave_timer()
+    gui._autosave_dirty = False
+    gui._autosave_digest = None
+
+    gui._loading = True
+    gui.tree.selection_set([])
+    gui._clear_editor()
+    gui._loading = False
+    gui.current_sheet = None
+    gui.current_source_path = None
+    gui.current_recipe_name = None
+
+    gui.project = project
+    gui._ctx_source_index = None
+    gui._ctx_recipe_path = None
+    gui._ctx_sheet_path = None
+    # Rebuild with the tree unmapped so Tk queues no redraws for the inserts;
+    # these tests only read the Treeview model, never its pixels.
+    gui.tree.grid_remove()
+    try:
+        gui.refresh_tree()
+    finally:
+        gui.tree.grid()
+    return gui
+
+
+@pytest.fixture
+def gui(gui_app):
+    """The shared app, reset to an empty project."""
+    return _reset_gui(gui_app, ProjectConfig())
+
+
 def _make_source(path: str = "src.xlsx") -> SourceConfig:
     sh = SheetConfig(
         name="Sheet1", workbook_sheet="Sheet1",
@@ -69,13 +139,17 @@ def _select(tree, item_id):
     tree.focus(item_id)
 
 
+def _drain(gui):
+    """Flush pending idle work once, after all of a test's state changes."""
+    gui.tk.call("update", "idletasks")
+
+
 def _load_sheet(gui, src_idx=0, rec_idx=0, sh_idx=0):
     src_id = gui.tree.get_children()[src_idx]
     rec_id = gui.tree.get_children(src_id)[rec_idx]
     sh_id  = gui.tree.get_children(rec_id)[sh_idx]
     _select(gui.tree, sh_id)
-    gui._on_tree_select()
-    gui.update_idletasks()
+    gui._on_tree_select()       # synchronous; no idle flush needed
     return sh_id
 
 
@@ -154,12 +228,48 @@ def test_run_selected_sheet_calls_engine_with_current_context(monkeypatch):
 # AUTOSAVE
 # ══════════════════════════════════════════════════════════════════════════════
 
-def test_mark_dirty_sets_autosave_dirty_flag():
-    gui = app.TurboExtractorApp()
+def test_mark_dirty_sets_autosave_dirty_flag(gui):
     gui._autosave_dirty = False
     gui._mark_dirty()
     assert gui._autosave_dirty is True
-    gui.destroy()
+
+
+def test_mark_dirty_burst_shares_one_pending_autosave(gui):
+    gui._mark_dirty()
+    pending = gui._autosave_after_id
+    assert pending is not None
+    for _ in range(5):
+        gui._mark_dirty()
+    assert gui._autosave_after_id == pending
+
+
+def test_autosave_now_clears_pending_timer(gui, monkeypatch):
+    saved = []
+    monkeypatch.setattr(app, "save_project_if_changed",
+                        lambda proj, path, digest: saved.append(path) or b"d")
+    gui._mark_dirty()
+    gui._autosave_now()
+    assert saved == [gui._autosave_path]
+    assert gui._autosave_after_id is None
+    assert gui._autosave_dirty is False
+    assert gui._autosave_digest == b"d"
+
+
+def test_autosave_now_skips_write_when_project_unchanged(gui, monkeypatch):
+    writes = []
+    monkeypatch.setattr(autosave, "atomic_write_bytes",
+                        lambda path, data: writes.append(path) or Path(path).write_bytes(data))
+    gui._mark_dirty()
+    gui._autosave_now()
+    gui._mark_dirty()
+    gui._autosave_now()
+    assert writes == [gui._autosave_path]
+    assert gui._autosave_dirty is False
+
+    _add_two_sources(gui)
+    gui._mark_dirty()
+    gui._autosave_now()
+    assert len(writes) == 2
 
 
 def test_autosave_saves_project_to_json(tmp_path, monkeypatch):
@@ -195,18 +305,15 @@ def test_gui_autoload_on_start(tmp_path, monkeypatch):
 # INLINE RENAME
 # ══════════════════════════════════════════════════════════════════════════════
 
-def test_inline_rename_recipe_updates_model():
-    gui = app.TurboExtractorApp()
+def test_inline_rename_recipe_updates_model(gui):
     gui.project = ProjectConfig(sources=[_make_source()])
     gui.refresh_tree()
 
     gui._apply_recipe_rename([0, 0], "NewRecipe")
     assert gui.project.sources[0].recipes[0].name == "NewRecipe"
-    gui.destroy()
 
 
-def test_inline_rename_sheet_updates_model_and_workbook_sheet():
-    gui = app.TurboExtractorApp()
+def test_inline_rename_sheet_updates_model_and_workbook_sheet(gui):
     gui.project = ProjectConfig(sources=[_make_source()])
     gui.refresh_tree()
 
@@ -214,15 +321,13 @@ def test_inline_rename_sheet_updates_model_and_workbook_sheet():
     gui._apply_sheet_rename([0, 0, 0], "NewSheetName")
     assert sheet.name == "NewSheetName"
     assert sheet.workbook_sheet == "NewSheetName"
-    gui.destroy()
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 # TREE STRUCTURE — ADD / REMOVE
 # ══════════════════════════════════════════════════════════════════════════════
 
-def test_remove_sheet_auto_removes_empty_recipe():
-    gui = app.TurboExtractorApp()
+def test_remove_sheet_auto_removes_empty_recipe(gui):
     gui.project = ProjectConfig(sources=[_make_source()])
     gui.refresh_tree()
 
@@ -233,11 +338,9 @@ def test_remove_sheet_auto_removes_empty_recipe():
     gui.remove_selected()
 
     assert len(gui.project.sources[0].recipes) == 0
-    gui.destroy()
 
 
-def test_add_rule_updates_model():
-    gui = app.TurboExtractorApp()
+def test_add_rule_updates_model(gui):
     gui.project = ProjectConfig(sources=[_make_source()])
     gui.refresh_tree()
     _load_sheet(gui)
@@ -245,87 +348,101 @@ def test_add_rule_updates_model():
     initial_count = len(gui.project.sources[0].recipes[0].sheets[0].rules)
     gui.add_rule()
     assert len(gui.project.sources[0].recipes[0].sheets[0].rules) == initial_count + 1
-    gui.destroy()
 
 
-def test_remove_selected_on_empty_selection_no_crash():
-    gui = app.TurboExtractorApp()
+def test_remove_selected_on_empty_selection_no_crash(gui):
     gui.tree.selection_set([])
     try:
         gui.remove_selected()
     except Exception as e:
         pytest.fail(f"remove_selected raised unexpectedly: {e}")
-    gui.destroy()
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 # TREE REORDER — MOVE BOUNDARIES
 # ══════════════════════════════════════════════════════════════════════════════
 
-def _make_gui_two_sources():
-    gui = app.TurboExtractorApp()
+def _add_two_sources(gui):
     for name in ["a.xlsx", "b.xlsx"]:
-        gui.project.sources.append(
+        gui.add_source(
             SourceConfig(path=name, recipes=[
                 RecipeConfig(name="R1", sheets=[
                     SheetConfig(name="S1", workbook_sheet="S1")
                 ])
             ])
         )
-    gui.refresh_tree()
     return gui
 
 
-def test_move_source_up_on_first_does_nothing():
-    gui = _make_gui_two_sources()
+def test_add_source_inserts_subtree_without_rebuilding_tree(gui):
+    _add_two_sources(gui)
+    first_id = gui.tree.get_children("")[0]
+    new_id = gui.add_source(SourceConfig(path="c.xlsx", recipes=[
+        RecipeConfig(name="R9", sheets=[SheetConfig(name="S9", workbook_sheet="S9")]),
+    ]))
+    assert gui.tree.get_children("") == (first_id, gui.tree.get_children("")[1], new_id)
+    assert gui.project.sources[-1].path == "c.xlsx"
+    r_id = gui.tree.get_children(new_id)[0]
+    assert gui.tree.item(r_id, "text") == "R9"
+    assert gui.tree.item(gui.tree.get_children(r_id)[0], "text") == "S9"
+
+
+def test_remove_source_keeps_remaining_tree_items(gui):
+    _add_two_sources(gui)
+    first_id, second_id = gui.tree.get_children("")
+    gui.tree.selection_set(first_id)
+    gui._on_tree_select()
+    gui.remove_selected()
+    assert gui.tree.get_children("") == (second_id,)
+    assert [s.path for s in gui.project.sources] == ["b.xlsx"]
+    assert gui.tree.selection() == (second_id,)
+
+
+def test_move_source_up_on_first_does_nothing(gui):
+    _add_two_sources(gui)
     src_id = gui.tree.get_children("")[0]
     gui.tree.selection_set(src_id)
     gui._on_tree_select()
     gui.move_source_up()
     assert gui.project.sources[0].path == "a.xlsx"
     assert gui.project.sources[1].path == "b.xlsx"
-    gui.destroy()
 
 
-def test_move_source_down_on_last_does_nothing():
-    gui = _make_gui_two_sources()
+def test_move_source_down_on_last_does_nothing(gui):
+    _add_two_sources(gui)
     src_ids = gui.tree.get_children("")
     gui.tree.selection_set(src_ids[1])
     gui._on_tree_select()
     gui.move_source_down()
     assert gui.project.sources[0].path == "a.xlsx"
     assert gui.project.sources[1].path == "b.xlsx"
-    gui.destroy()
 
 
-def test_move_source_up_swaps_sources():
-    gui = _make_gui_two_sources()
+def test_move_source_up_swaps_sources(gui):
+    _add_two_sources(gui)
     src_ids = gui.tree.get_children("")
     gui.tree.selection_set(src_ids[1])
     gui._on_tree_select()
     gui.move_source_up()
     assert gui.project.sources[0].path == "b.xlsx"
     assert gui.project.sources[1].path == "a.xlsx"
-    gui.destroy()
 
 
-def test_move_source_down_swaps_sources():
-    gui = _make_gui_two_sources()
+def test_move_source_down_swaps_sources(gui):
+    _add_two_sources(gui)
     src_ids = gui.tree.get_children("")
     gui.tree.selection_set(src_ids[0])
     gui._on_tree_select()
     gui.move_source_down()
     assert gui.project.sources[0].path == "b.xlsx"
     assert gui.project.sources[1].path == "a.xlsx"
-    gui.destroy()
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 # EDITOR FIELD SYNC
 # ══════════════════════════════════════════════════════════════════════════════
 
-def test_paste_mode_pack_together_maps_to_pack():
-    gui = app.TurboExtractorApp()
+def test_paste_mode_pack_together_maps_to_pack(gui):
     gui.project.sources.append(_make_source())
     gui.refresh_tree()
     _load_sheet(gui)
@@ -333,11 +450,9 @@ def test_paste_mode_pack_together_maps_to_pack():
     gui.paste_var.set("Pack Together")
     gui._push_editor_to_sheet()
     assert gui.project.sources[0].recipes[0].sheets[0].paste_mode == "pack"
-    gui.destroy()
 
 
-def test_paste_mode_keep_format_maps_to_keep():
-    gui = app.TurboExtractorApp()
+def test_paste_mode_keep_format_maps_to_keep(gui):
     gui.project.sources.append(_make_source())
     gui.refresh_tree()
     _load_sheet(gui)
@@ -345,11 +460,9 @@ def test_paste_mode_keep_format_maps_to_keep():
     gui.paste_var.set("Keep Format")
     gui._push_editor_to_sheet()
     assert gui.project.sources[0].recipes[0].sheets[0].paste_mode == "keep"
-    gui.destroy()
 
 
-def test_combine_var_or_syncs_to_model():
-    gui = app.TurboExtractorApp()
+def test_combine_var_or_syncs_to_model(gui):
     gui.project.sources.append(_make_source())
     gui.refresh_tree()
     _load_sheet(gui)
@@ -357,11 +470,9 @@ def test_combine_var_or_syncs_to_model():
     gui.combine_var.set("OR")
     gui._push_editor_to_sheet()
     assert gui.project.sources[0].recipes[0].sheets[0].rules_combine == "OR"
-    gui.destroy()
 
 
-def test_source_start_row_var_syncs_to_model():
-    gui = app.TurboExtractorApp()
+def test_source_start_row_var_syncs_to_model(gui):
     gui.project.sources.append(_make_source())
     gui.refresh_tree()
     _load_sheet(gui)
@@ -369,11 +480,9 @@ def test_source_start_row_var_syncs_to_model():
     gui.source_start_row_var.set("5")
     gui._push_editor_to_sheet()
     assert gui.project.sources[0].recipes[0].sheets[0].source_start_row == "5"
-    gui.destroy()
 
 
-def test_dest_start_col_var_syncs_to_model():
-    gui = app.TurboExtractorApp()
+def test_dest_start_col_var_syncs_to_model(gui):
     gui.project.sources.append(_make_source())
     gui.refresh_tree()
     _load_sheet(gui)
@@ -381,11 +490,9 @@ def test_dest_start_col_var_syncs_to_model():
     gui.start_col_var.set("D")
     gui._push_editor_to_sheet()
     assert gui.project.sources[0].recipes[0].sheets[0].destination.start_col == "D"
-    gui.destroy()
 
 
-def test_editor_not_pushed_while_loading():
-    gui = app.TurboExtractorApp()
+def test_editor_not_pushed_while_loading(gui):
     gui.project.sources.append(_make_source())
     gui.refresh_tree()
     _load_sheet(gui)
@@ -397,108 +504,94 @@ def test_editor_not_pushed_while_loading():
     gui.paste_var.set("Keep Format")
     gui._push_editor_to_sheet()
     assert sheet.paste_mode == original_mode
-    gui.destroy()
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 # SELECTION NAME VAR
 # ══════════════════════════════════════════════════════════════════════════════
 
-def _make_gui_with_project():
-    gui = app.TurboExtractorApp()
+@pytest.fixture
+def gui_with_project(gui_app):
     src = SourceConfig(path="C:/data/source_file.xlsx", recipes=[
         RecipeConfig(name="MyRecipe", sheets=[
             SheetConfig(name="MySheet", workbook_sheet="MySheet"),
         ])
     ])
-    gui.project = ProjectConfig(sources=[src])
-    gui.refresh_tree()
-    return gui
+    return _reset_gui(gui_app, ProjectConfig(sources=[src]))
 
 
-def test_selection_name_var_set_to_filename_on_source_select():
-    gui = _make_gui_with_project()
+def test_selection_name_var_set_to_filename_on_source_select(gui_with_project):
+    gui = gui_with_project
     src_id = gui.tree.get_children("")[0]
     gui.tree.selection_set(src_id)
     gui._on_tree_select()
     name = gui.selection_name_var.get()
     assert "source_file.xlsx" in name
     assert "C:/data" not in name
-    gui.destroy()
 
 
-def test_selection_name_var_set_to_recipe_name_on_recipe_select():
-    gui = _make_gui_with_project()
+def test_selection_name_var_set_to_recipe_name_on_recipe_select(gui_with_project):
+    gui = gui_with_project
     src_id = gui.tree.get_children("")[0]
     rec_id = gui.tree.get_children(src_id)[0]
     gui.tree.selection_set(rec_id)
     gui._on_tree_select()
     assert gui.selection_name_var.get() == "MyRecipe"
-    gui.destroy()
 
 
-def test_selection_name_var_set_to_sheet_name_on_sheet_select():
-    gui = _make_gui_with_project()
+def test_selection_name_var_set_to_sheet_name_on_sheet_select(gui_with_project):
+    gui = gui_with_project
     src_id = gui.tree.get_children("")[0]
     rec_id = gui.tree.get_children(src_id)[0]
     sh_id  = gui.tree.get_children(rec_id)[0]
     gui.tree.selection_set(sh_id)
     gui._on_tree_select()
     assert gui.selection_name_var.get() == "MySheet"
-    gui.destroy()
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 # CONTEXT MENU WIRING
 # ══════════════════════════════════════════════════════════════════════════════
 
-def _make_gui_3level():
-    gui = app.TurboExtractorApp()
-    gui.project = ProjectConfig(sources=[_make_source("test_src.xlsx")])
-    gui.refresh_tree()
-    return gui
+@pytest.fixture
+def gui_3level(gui_app):
+    return _reset_gui(gui_app, ProjectConfig(sources=[_make_source("test_src.xlsx")]))
 
 
-def test_ctx_source_index_set_on_right_click():
-    gui = _make_gui_3level()
+def test_ctx_source_index_set_on_right_click(gui_3level):
+    gui = gui_3level
     src_id = gui.tree.get_children("")[0]
     path = gui._get_tree_path(src_id)
     gui._ctx_source_index = path[0]
     assert gui._ctx_source_index == 0
-    gui.destroy()
 
 
-def test_get_ctx_source_returns_none_when_index_none():
-    gui = _make_gui_3level()
+def test_get_ctx_source_returns_none_when_index_none(gui_3level):
+    gui = gui_3level
     gui._ctx_source_index = None
     assert gui._get_ctx_source() is None
-    gui.destroy()
 
 
-def test_get_ctx_source_returns_correct_source():
-    gui = _make_gui_3level()
+def test_get_ctx_source_returns_correct_source(gui_3level):
+    gui = gui_3level
     gui._ctx_source_index = 0
     src = gui._get_ctx_source()
     assert src is gui.project.sources[0]
-    gui.destroy()
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 # _FORMAT_RUN_REPORT
 # ══════════════════════════════════════════════════════════════════════════════
 
-def test_format_run_report_success_format():
-    gui = app.TurboExtractorApp()
+def test_format_run_report_success_format(gui):
     report = RunReport(ok=True, results=[_make_result("MyRecipe", "MySheet", 42)])
     text = gui._format_run_report(report)
     assert "MyRecipe" in text
     assert "MySheet" in text
     assert "42" in text
-    gui.destroy()
 
 
-def test_format_run_report_error_format():
-    gui = app.TurboExtractorApp()
+def test_format_run_report_error_format(gui):
     report = RunReport(ok=False, results=[
         _make_result("R1", "S1", 0, error_code="DEST_BLOCKED", error_msg="Zone blocked")
     ])
@@ -506,18 +599,14 @@ def test_format_run_report_error_format():
     assert "ERROR" in text
     assert "DEST_BLOCKED" in text
     assert "Zone blocked" in text
-    gui.destroy()
 
 
-def test_format_run_report_empty_results_returns_no_work_items():
-    gui = app.TurboExtractorApp()
+def test_format_run_report_empty_results_returns_no_work_items(gui):
     text = gui._format_run_report(RunReport(ok=True, results=[]))
     assert text == "No work items."
-    gui.destroy()
 
 
-def test_format_run_report_multiple_results_all_present():
-    gui = app.TurboExtractorApp()
+def test_format_run_report_multiple_results_all_present(gui):
     report = RunReport(ok=True, results=[
         _make_result("R1", "S1", 10),
         _make_result("R2", "S2", 0, error_code="BAD_SPEC", error_msg="oops"),
@@ -527,36 +616,57 @@ def test_format_run_report_multiple_results_all_present():
     assert "R1" in text and "10" in text
     assert "R2" in text and "BAD_SPEC" in text
     assert "R3" in text and "7" in text
-    gui.destroy()
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 # SCROLLABLE REPORT DIALOG
 # ══════════════════════════════════════════════════════════════════════════════
 
-def test_show_scrollable_report_dialog_creates_toplevel():
-    gui = app.TurboExtractorApp()
+def test_show_scrollable_report_dialog_creates_toplevel(gui):
     gui._show_scrollable_report_dialog("Test Title", "Line1\nLine2")
-    gui.update_idletasks()
+    _drain(gui)
     assert gui._report_dialog is not None
     assert isinstance(gui._report_dialog, tk.Toplevel)
     gui._report_dialog.destroy()
     gui._report_dialog = None
-    gui.destroy()
 
 
-def test_show_scrollable_report_dialog_second_call_replaces_first():
-    gui = app.TurboExtractorApp()
+def test_show_scrollable_report_dialog_second_call_replaces_first(gui):
     gui._show_scrollable_report_dialog("First", "text1")
-    gui.update_idletasks()
     first_dialog = gui._report_dialog
 
     gui._show_scrollable_report_dialog("Second", "text2")
-    gui.update_idletasks()
+    _drain(gui)
     second_dialog = gui._report_dialog
 
-    assert second_dialog is not first_dialog
-    gui.destroy()
+    # The open dialog is recycled: same Toplevel, new title and content.
+    assert second_dialog is first_dialog
+    assert second_dialog.title() == "Second"
+    assert gui._report_text.get("1.0", "end-1c") == "text2\n"
+
+
+def test_show_scrollable_report_dialog_rebuilds_after_close(gui):
+    gui._show_scrollable_report_dialog("First", "text1")
+    first_dialog = gui._report_dialog
+    first_dialog.destroy()
+
+    gui._show_scrollable_report_dialog("Again", "text2")
+    _drain(gui)
+    assert gui._report_dialog is not first_dialog
+    assert gui._report_dialog.title() == "Again"
+
+
+def test_show_scrollable_report_dialog_tags_every_line(gui):
+    text = "\u2550\u2550\n  \u2713  R / S \u2014 1 row written\n     Source : a.xlsx\nplain"
+    gui._show_scrollable_report_dialog("Tags", text)
+    _drain(gui)
+    txt = gui._report_text
+
+    assert txt.get("1.0", "end-1c") == text + "\n"
+    for lineno, tag in enumerate(["hdr", "ok_line", "meta", "plain"], 1):
+        assert txt.tag_names(f"{lineno}.0") == (tag,)
+    gui._report_dialog.destroy()
+    gui._report_dialog = None
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -578,15 +688,12 @@ def _find_button(widget, label):
     return None
 
 
-def test_add_source_and_run_buttons_exist():
-    gui = app.TurboExtractorApp()
+def test_add_source_and_run_buttons_exist(gui):
     assert _find_button(gui, "Add Source (XLSX/CSV)") is not None
     assert _find_button(gui, "RUN") is not None
-    gui.destroy()
 
 
-def test_tree_fully_expanded_by_default():
-    gui = app.TurboExtractorApp()
+def test_tree_fully_expanded_by_default(gui):
     gui.project.sources.append(SourceConfig(
         path="C:/tmp/example.xlsx",
         recipes=[RecipeConfig(name="Recipe1",
@@ -594,7 +701,6 @@ def test_tree_fully_expanded_by_default():
                                                   workbook_sheet="Sheet1")])],
     ))
     gui.refresh_tree()
-    gui.update_idletasks()
+    _drain(gui)
     for s_id in gui.tree.get_children(""):
         assert gui.tree.item(s_id, "open") in (True, 1, "1")
-    gui.destroy()
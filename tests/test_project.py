@@ -5,15 +5,24 @@ Covers:
   - core.project: ProjectConfig serialization, load/save JSON, build_run_items
   - core.templates: source_to_template, apply_template_to_source,
                     save/load template JSON, default template management
+  - core.autosave:  save_project_if_changed
 """
 from __future__ import annotations
 
+import functools
 import os
+from dataclasses import asdict
 from pathlib import Path
 
+import pytest
+
 from core.models import Destination, Rule, SheetConfig
 from core.project import ProjectConfig, RecipeConfig, SourceConfig
-from core import templates as tpl
+from core import autosave, jsonio, templates as tpl
+
+
+# Module-scoped fixtures: keep this file on one xdist worker (--dist=loadgroup)
+pytestmark = pytest.mark.xdist_group("project")
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -33,11 +42,19 @@ def _make_source(path: str) -> SourceConfig:
     return SourceConfig(path=path, recipes=[r])
 
 
+@functools.lru_cache(maxsize=None)
+def _shared_source(path: str) -> SourceConfig:
+    """_make_source built once per path, for tests that only read it (never mutate)."""
+    return _make_source(path)
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # PROJECTCONFIG — SERIALIZATION
 # ══════════════════════════════════════════════════════════════════════════════
 
-def test_project_config_save_load_roundtrip(tmp_path):
+@pytest.fixture(scope="module")
+def loaded_proj(tmp_path_factory):
+    """Four-sheet, two-source project saved and reloaded once per module; read-only."""
     proj = ProjectConfig(sources=[
         SourceConfig(path="a.xlsx", recipes=[
             RecipeConfig(name="R1", sheets=[
@@ -59,45 +76,23 @@ def test_project_config_save_load_roundtrip(tmp_path):
         ]),
     ])
 
-    p = str(tmp_path / "proj.json")
+    p = str(tmp_path_factory.mktemp("project_json") / "loaded_proj.json")
     proj.save_json(p)
-    loaded = ProjectConfig.load_json(p)
+    return ProjectConfig.load_json(p)
 
-    assert len(loaded.sources) == 2
-    assert loaded.sources[0].recipes[0].sheets[1].name == "S2"
-    assert loaded.sources[0].recipes[1].name == "R2"
-    assert loaded.sources[1].path == "b.csv"
 
+def test_project_config_save_load_roundtrip(loaded_proj):
+    assert len(loaded_proj.sources) == 2
+    assert loaded_proj.sources[0].recipes[0].sheets[1].name == "S2"
+    assert loaded_proj.sources[0].recipes[1].name == "R2"
+    assert loaded_proj.sources[1].path == "b.csv"
 
-def test_project_build_run_items_order(tmp_path):
-    proj = ProjectConfig(sources=[
-        SourceConfig(path="a.xlsx", recipes=[
-            RecipeConfig(name="R1", sheets=[
-                SheetConfig(name="S1", workbook_sheet="S1",
-                            destination=Destination(file_path="o.xlsx")),
-                SheetConfig(name="S2", workbook_sheet="S2",
-                            destination=Destination(file_path="o.xlsx")),
-            ]),
-            RecipeConfig(name="R2", sheets=[
-                SheetConfig(name="S3", workbook_sheet="S3",
-                            destination=Destination(file_path="o.xlsx")),
-            ]),
-        ]),
-        SourceConfig(path="b.csv", recipes=[
-            RecipeConfig(name="R3", sheets=[
-                SheetConfig(name="S4", workbook_sheet="S4",
-                            destination=Destination(file_path="o2.xlsx")),
-            ]),
-        ]),
-    ])
-
-    p = str(tmp_path / "proj.json")
-    proj.save_json(p)
-    loaded = ProjectConfig.load_json(p)
 
-    items = loaded.build_run_items()
+def test_project_build_run_items_order(loaded_proj):
+    items = loaded_proj.build_run_items()
     assert len(items) == 4
     assert [i[1] for i in items] == ["R1", "R1", "R2", "R3"]
+    assert [i[2].name for i in items] == ["S1", "S2", "S3", "S4"]
 
 
 def test_project_config_empty_project_roundtrip(tmp_path):
@@ -109,6 +104,78 @@ def test_project_config_empty_project_roundtrip(tmp_path):
     assert loaded.build_run_items() == []
 
 
+def test_project_to_dict_matches_asdict_and_roundtrips():
+    sh = SheetConfig(
+        name="S", workbook_sheet="S", columns_spec="A,C",
+        rules=[Rule(mode="exclude", column="B", operator="<", value="5")],
+        destination=Destination(file_path="d.xlsx", start_row="4"),
+    )
+    proj = ProjectConfig(sources=[
+        SourceConfig(path="a.xlsx", recipes=[RecipeConfig(name="R", sheets=[sh])]),
+    ])
+    d = proj.to_dict()
+    assert d == asdict(proj)
+    assert ProjectConfig.from_dict(d) == proj
+
+
+def test_project_config_save_json_is_compact_and_atomic(tmp_path):
+    proj = ProjectConfig(sources=[SourceConfig(path="a.xlsx", recipes=[])])
+    p    = tmp_path / "proj.json"
+    proj.save_json(str(p))
+    text = p.read_text(encoding="utf-8")
+    assert "\n" not in text and ", " not in text
+    assert not (tmp_path / "proj.json.tmp").exists()
+    assert ProjectConfig.load_json(str(p)).sources[0].path == "a.xlsx"
+
+def test_project_config_save_json_accepts_path_and_cleans_up_on_failure(tmp_path, monkeypatch):
+    proj = ProjectConfig(sources=[SourceConfig(path="a.xlsx", recipes=[])])
+    p    = tmp_path / "proj.json"
+    proj.save_json(p)                                   # pathlib.Path, not str
+    assert ProjectConfig.load_json(p) == proj
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail)
+    with pytest.raises(OSError):
+        proj.save_json(p)
+    assert sorted(x.name for x in tmp_path.iterdir()) == ["proj.json"]
+
+
+@pytest.mark.parametrize("backend", ["orjson", "stdlib"])
+def test_project_and_template_json_roundtrip_on_each_backend(tmp_path, monkeypatch, backend):
+    if backend == "stdlib":
+        monkeypatch.setattr(jsonio, "orjson", None)
+    elif jsonio.orjson is None:
+        pytest.skip("orjson not installed")
+    src = _shared_source("caf\u00e9.xlsx")
+    proj = ProjectConfig(sources=[src])
+
+    p = str(tmp_path / "proj.json")
+    proj.save_json(p)
+    assert ProjectConfig.load_json(p) == proj
+
+    t = str(tmp_path / "t.json")
+    tpl.save_template_json(tpl.source_to_template(src), t)
+    assert "\n  " in Path(t).read_text(encoding="utf-8")   # templates stay indented
+    assert tpl.load_template_json(t) == tpl.source_to_template(src)
+
+
+@pytest.mark.parametrize("backend", ["orjson", "stdlib"])
+def test_save_json_writes_only_to_dict_fields(tmp_path, monkeypatch, backend):
+    """Ad-hoc attributes (the GUI sets src.name) never reach the project file."""
+    if backend == "stdlib":
+        monkeypatch.setattr(jsonio, "orjson", None)
+    elif jsonio.orjson is None:
+        pytest.skip("orjson not installed")
+    src = SourceConfig(path="x", recipes=[])
+    src.name = "foo"
+    proj = ProjectConfig(sources=[src])
+    p = tmp_path / "proj.json"
+    proj.save_json(str(p))
+    assert p.read_bytes() == b'{"sources":[{"path":"x","recipes":[]}]}'
+
+
 def test_project_config_preserves_all_sheet_fields(tmp_path):
     sh = SheetConfig(
         name="Full", workbook_sheet="FullWB",
@@ -143,7 +210,7 @@ def test_project_config_preserves_all_sheet_fields(tmp_path):
 # ══════════════════════════════════════════════════════════════════════════════
 
 def test_source_template_roundtrip_preserves_path(tmp_path):
-    src1     = _make_source("/tmp/source1.xlsx")
+    src1     = _shared_source("/tmp/source1.xlsx")
     template = tpl.source_to_template(src1)
 
     p = tmp_path / "t.json"
@@ -197,13 +264,25 @@ def test_template_all_sheet_fields_roundtrip(tmp_path):
 
 
 def test_template_does_not_include_source_path(tmp_path):
-    src  = _make_source("/private/path/source.xlsx")
+    src  = _shared_source("/private/path/source.xlsx")
     tmpl = tpl.source_to_template(src)
     assert "path" not in tmpl or tmpl.get("path") != "/private/path/source.xlsx"
 
 
+def test_template_is_plain_dicts_detached_from_source():
+    src  = _shared_source("a.xlsx")
+    tmpl = tpl.source_to_template(src)
+    assert tmpl["recipes"][0]["sheets"] == [asdict(src.recipes[0].sheets[0])]
+
+    tmpl["recipes"][0]["sheets"][0]["rules"][0]["value"] = "changed"
+    tmpl["recipes"][0]["sheets"][0]["destination"]["start_col"] = "Z"
+    sh = src.recipes[0].sheets[0]
+    assert sh.rules[0].value == "beta"
+    assert sh.destination.start_col == "D"
+
+
 def test_default_template_set_load_reset(tmp_path, monkeypatch):
-    src      = _make_source("/tmp/source.xlsx")
+    src      = _shared_source("/tmp/source.xlsx")
     template = tpl.source_to_template(src)
 
     default_path = tmp_path / "default.json"
@@ -239,3 +318,31 @@ def test_template_apply_replaces_all_recipes(tmp_path):
     assert len(tgt.recipes) == 2
     assert tgt.recipes[0].name == "Recipe1"
     assert tgt.recipes[1].name == "Recipe2"
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# AUTOSAVE — CHANGE DETECTION
+# ══════════════════════════════════════════════════════════════════════════════
+
+def test_save_project_if_changed_skips_identical_payload(tmp_path, monkeypatch):
+    writes = []
+    real_write = autosave.atomic_write_bytes
+    monkeypatch.setattr(autosave, "atomic_write_bytes",
+                        lambda path, data: writes.append(path) or real_write(path, data))
+    proj = ProjectConfig(sources=[_make_source("a.xlsx")])
+    p    = str(tmp_path / "auto.json")
+
+    d1 = autosave.save_project_if_changed(proj, p, None)
+    d2 = autosave.save_project_if_changed(proj, p, d1)
+    assert d1 == d2 and writes == [p]
+    assert ProjectConfig.load_json(p) == proj
+
+    os.remove(p)                                    # missing file is always rewritten
+    autosave.save_project_if_changed(proj, p, d2)
+    proj.sources[0].recipes[0].name = "Renamed"     # so is a changed project
+    d3 = autosave.save_project_if_changed(proj, p, d2)
+    assert d3 != d2 and writes == [p, p, p]
+
+    other = str(tmp_path / "other.json")            # digest is per target path
+    autosave.save_project_if_changed(proj, other, d3)
+    assert writes[-1] == other
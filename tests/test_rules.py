@@ -1,5 +1,5 @@
 """
-test_rules.py — Comprehensive tests for core.rules.apply_rules.
+test_rules.py — Comprehensive tests for core.rules.apply_rules / compile_rules.
 
 Covers:
   - contains: basic, case-insensitive, empty target, None cell
@@ -9,12 +9,15 @@ Covers:
   - AND / OR combine modes
   - Multiple rules interactions
   - Edge cases: empty row list, column beyond row width, bad mode, bad operator
+  - compile_rules: standalone predicate agrees with apply_rules
+  - Selectivity ordering of multi-rule predicates on longer tables
 """
 from __future__ import annotations
 
 import pytest
 
-from core.rules import apply_rules
+from core import rules as rules_mod
+from core.rules import apply_rules, compile_rules
 from core.models import Rule
 from core.errors import AppError, INVALID_RULE
 
@@ -37,12 +40,12 @@ def _apply(rows, op, val, col="A", mode="include", combine="AND"):
 
 def test_no_rules_and_returns_all():
     rows = [["a"], ["b"], ["c"]]
-    assert apply_rules(rows, [], "AND") == rows
+    assert apply_rules(rows, [], "AND") is rows      # same list, no copy
 
 
 def test_no_rules_or_returns_all():
     rows = [["a"], ["b"]]
-    assert apply_rules(rows, [], "OR") == rows
+    assert apply_rules(rows, [], "OR") is rows
 
 
 def test_empty_input_rows_returns_empty():
@@ -50,312 +53,144 @@ def test_empty_input_rows_returns_empty():
 
 
 # ══════════════════════════════════════════════════════════════════════════════
-# CONTAINS
+# SINGLE RULE — one table per operator group
+# Each case: (rows, value, column, mode, expected kept rows in order)
 # ══════════════════════════════════════════════════════════════════════════════
 
-def test_contains_basic_match():
-    rows = [["apple"], ["banana"], ["cherry"]]
-    result = _apply(rows, "contains", "an")
-    assert len(result) == 1
-    assert result[0][0] == "banana"
-
-
-def test_contains_case_insensitive():
-    rows = [["Green Apple"], ["banana"]]
-    result = _apply(rows, "contains", "apple")
-    assert len(result) == 1
-    assert result[0][0] == "Green Apple"
-
-
-def test_contains_empty_target_matches_all():
-    rows = [["alpha"], ["beta"], ["gamma"]]
-    result = _apply(rows, "contains", "")
-    assert len(result) == 3
-
-
-def test_contains_none_cell_no_match():
-    rows = [[None], ["hello"]]
-    result = _apply(rows, "contains", "hello")
-    assert len(result) == 1
-    assert result[0][0] == "hello"
-
-
-def test_contains_numeric_cell_matches_substring():
-    rows = [[12345], [99]]
-    result = _apply(rows, "contains", "23")
-    assert len(result) == 1
-    assert result[0][0] == 12345
-
-
-def test_contains_exclude_inverts():
-    rows = [["apple"], ["banana"], ["cherry"]]
-    result = _apply(rows, "contains", "an", mode="exclude")
-    names = [r[0] for r in result]
-    assert "banana" not in names
-    assert "apple" in names and "cherry" in names
-
-
-# ══════════════════════════════════════════════════════════════════════════════
-# EQUALS
-# ══════════════════════════════════════════════════════════════════════════════
-
-def test_equals_exact_string_match():
-    rows = [["alpha"], ["beta"], ["gamma"]]
-    result = _apply(rows, "equals", "alpha")
-    assert len(result) == 1
-    assert result[0][0] == "alpha"
-
-
-def test_equals_case_insensitive():
-    rows = [["Alpha"], ["BETA"], ["gamma"]]
-    result = _apply(rows, "equals", "alpha")
-    assert len(result) == 1
-    assert result[0][0] == "Alpha"
-
-
-def test_equals_strips_whitespace():
-    rows = [["  alpha  "], ["beta"]]
-    result = _apply(rows, "equals", "alpha")
-    assert len(result) == 1
-
-
-def test_equals_numeric_cell_matches_numeric_string():
-    """Integer 2 should equal rule value "2"."""
-    rows = [[1], [2], [3]]
-    result = _apply(rows, "equals", "2")
-    assert len(result) == 1
-    assert result[0][0] == 2
-
-
-def test_equals_float_cell_matches_int_string():
-    """Float 2.0 should equal rule value "2"."""
-    rows = [[2.0], [3.5]]
-    result = _apply(rows, "equals", "2")
-    assert len(result) == 1
-    assert result[0][0] == 2.0
-
-
-def test_equals_none_cell_matches_empty_string_target():
-    rows = [[None], ["hello"]]
-    result = _apply(rows, "equals", "")
-    assert len(result) == 1
-    assert result[0][0] is None
-
-
-def test_equals_none_cell_does_not_match_nonempty_target():
-    rows = [[None], ["hello"]]
-    result = _apply(rows, "equals", "None")
-    assert len(result) == 0
-
-
-def test_equals_zero_matches_zero_string():
-    rows = [[0], [1], [2]]
-    result = _apply(rows, "equals", "0")
-    assert len(result) == 1
-    assert result[0][0] == 0
-
-
-def test_equals_exclude_inverts():
-    rows = [["alpha"], ["beta"], ["gamma"]]
-    result = _apply(rows, "equals", "beta", mode="exclude")
-    names = [r[0] for r in result]
-    assert "beta" not in names
-    assert len(result) == 2
-
-
-# ══════════════════════════════════════════════════════════════════════════════
-# GREATER THAN / LESS THAN
-# ══════════════════════════════════════════════════════════════════════════════
-
-def test_greater_than_numeric():
-    rows = [[10], [20], [30]]
-    result = _apply(rows, ">", "15")
-    assert len(result) == 2
-    assert all(r[0] > 15 for r in result)
-
-
-def test_less_than_numeric():
-    rows = [[10], [20], [30]]
-    result = _apply(rows, "<", "25")
-    assert len(result) == 2
-    assert all(r[0] < 25 for r in result)
-
-
-def test_greater_than_with_floats():
-    rows = [[1.5], [2.5], [3.5]]
-    result = _apply(rows, ">", "2.0")
-    assert len(result) == 2
-
-
-def test_less_than_negative_numbers():
-    rows = [[-10], [-5], [0], [5]]
-    result = _apply(rows, "<", "-3")
-    assert len(result) == 2
-    assert all(r[0] < -3 for r in result)
-
-
-def test_greater_than_non_numeric_cell_skipped():
-    """Text cells that can't be coerced to float should not match."""
-    rows = [["text"], [100], [200]]
-    result = _apply(rows, ">", "50")
-    assert len(result) == 2
-    assert all(isinstance(r[0], (int, float)) for r in result)
-
-
-def test_less_than_none_cell_skipped():
-    rows = [[None], [5], [50]]
-    result = _apply(rows, "<", "10")
-    assert len(result) == 1
-    assert result[0][0] == 5
-
-
-def test_greater_than_non_numeric_target_matches_nothing():
-    rows = [[100], [200]]
-    result = _apply(rows, ">", "not_a_number")
-    assert len(result) == 0
-
-
-def test_greater_than_exclude():
-    rows = [[10], [20], [30]]
-    result = _apply(rows, ">", "15", mode="exclude")
-    assert len(result) == 1
-    assert result[0][0] == 10
-
-
-# ══════════════════════════════════════════════════════════════════════════════
-# COLUMN SELECTION
-# ══════════════════════════════════════════════════════════════════════════════
-
-def test_rule_on_non_first_column():
-    rows = [["keep", "yes", 1],
-            ["drop", "no",  2],
-            ["keep", "yes", 3]]
-    result = _apply(rows, "equals", "yes", col="B")
-    assert len(result) == 2
-    assert all(r[1] == "yes" for r in result)
-
-
-def test_rule_column_beyond_row_width_no_match_no_crash():
-    rows = [["a"], ["b"]]
-    result = _apply(rows, "equals", "a", col="Z")
-    assert result == []
-
-
-def test_rule_on_column_c():
-    rows = [["x", "y", "target"],
-            ["x", "y", "other"]]
-    result = _apply(rows, "equals", "target", col="C")
-    assert len(result) == 1
-    assert result[0][2] == "target"
+_CONTAINS_CASES = {
+    "basic_match":             ([["apple"], ["banana"], ["cherry"]], "an", "A", "include",
+                                [["banana"]]),
+    "case_insensitive":        ([["Green Apple"], ["banana"]], "apple", "A", "include",
+                                [["Green Apple"]]),
+    "empty_target_matches_all": ([["alpha"], ["beta"], ["gamma"]], "", "A", "include",
+                                 [["alpha"], ["beta"], ["gamma"]]),
+    "none_cell_no_match":      ([[None], ["hello"]], "hello", "A", "include",
+                                [["hello"]]),
+    "numeric_cell_substring":  ([[12345], [99]], "23", "A", "include",
+                                [[12345]]),
+    "exclude_inverts":         ([["apple"], ["banana"], ["cherry"]], "an", "A", "exclude",
+                                [["apple"], ["cherry"]]),
+}
+
+_EQUALS_CASES = {
+    "exact_string":            ([["alpha"], ["beta"], ["gamma"]], "alpha", "A", "include",
+                                [["alpha"]]),
+    "case_insensitive":        ([["Alpha"], ["BETA"], ["gamma"]], "alpha", "A", "include",
+                                [["Alpha"]]),
+    "strips_whitespace":       ([["  alpha  "], ["beta"]], "alpha", "A", "include",
+                                [["  alpha  "]]),
+    # Integer 2 / float 2.0 equal rule value "2" (numeric comparison first)
+    "int_cell_numeric_string": ([[1], [2], [3]], "2", "A", "include",
+                                [[2]]),
+    "float_cell_int_string":   ([[2.0], [3.5]], "2", "A", "include",
+                                [[2.0]]),
+    "none_cell_empty_target":  ([[None], ["hello"]], "", "A", "include",
+                                [[None]]),
+    "none_cell_nonempty_target": ([[None], ["hello"]], "None", "A", "include",
+                                  []),
+    "zero_matches_zero_string": ([[0], [1], [2]], "0", "A", "include",
+                                 [[0]]),
+    "exclude_inverts":         ([["alpha"], ["beta"], ["gamma"]], "beta", "A", "exclude",
+                                [["alpha"], ["gamma"]]),
+}
+
+_GREATER_CASES = {
+    "numeric":                 ([[10], [20], [30]], "15", "A", "include",
+                                [[20], [30]]),
+    "floats":                  ([[1.5], [2.5], [3.5]], "2.0", "A", "include",
+                                [[2.5], [3.5]]),
+    # Text cells that can't be coerced to float should not match
+    "non_numeric_cell_skipped": ([["text"], [100], [200]], "50", "A", "include",
+                                 [[100], [200]]),
+    "non_numeric_target_matches_nothing": ([[100], [200]], "not_a_number", "A", "include",
+                                           []),
+    "exclude":                 ([[10], [20], [30]], "15", "A", "exclude",
+                                [[10]]),
+}
+
+_LESS_CASES = {
+    "numeric":                 ([[10], [20], [30]], "25", "A", "include",
+                                [[10], [20]]),
+    "negative_numbers":        ([[-10], [-5], [0], [5]], "-3", "A", "include",
+                                [[-10], [-5]]),
+    "none_cell_skipped":       ([[None], [5], [50]], "10", "A", "include",
+                                [[5]]),
+}
+
+_COLUMN_CASES = {
+    "non_first_column":        ([["keep", "yes", 1], ["drop", "no", 2], ["keep", "yes", 3]],
+                                "yes", "B", "include",
+                                [["keep", "yes", 1], ["keep", "yes", 3]]),
+    "beyond_row_width_no_crash": ([["a"], ["b"]], "a", "Z", "include",
+                                  []),
+    "column_c":                ([["x", "y", "target"], ["x", "y", "other"]],
+                                "target", "C", "include",
+                                [["x", "y", "target"]]),
+}
+
+
+def _single_rule_params(op, cases):
+    return [pytest.param(op, *case, id=f"{op}-{name}") for name, case in cases.items()]
+
+
+@pytest.mark.parametrize("op,rows,val,col,mode,expected", [
+    *_single_rule_params("contains", _CONTAINS_CASES),
+    *_single_rule_params("equals", _EQUALS_CASES),
+    *_single_rule_params(">", _GREATER_CASES),
+    *_single_rule_params("<", _LESS_CASES),
+    *_single_rule_params("equals", _COLUMN_CASES),
+])
+def test_single_rule(op, rows, val, col, mode, expected):
+    assert _apply(rows, op, val, col=col, mode=mode) == expected
 
 
 # ══════════════════════════════════════════════════════════════════════════════
-# AND / OR COMBINE MODES
+# MULTIPLE RULES — AND / OR, mixed include / exclude
+# Each case: (rows, rules, combine, expected kept rows in order)
 # ══════════════════════════════════════════════════════════════════════════════
 
-def test_and_both_true_keeps_row():
-    rows = [["alpha", 20], ["beta", 5]]
-    rules = [
-        _rule("equals", "alpha", col="A"),
-        _rule(">", "10", col="B"),
-    ]
-    result = apply_rules(rows, rules, "AND")
-    assert len(result) == 1
-    assert result[0][0] == "alpha"
-
-
-def test_and_one_false_drops_row():
-    rows = [["alpha", 5], ["beta", 20]]
-    rules = [
-        _rule("equals", "alpha", col="A"),
-        _rule(">", "10", col="B"),
-    ]
-    result = apply_rules(rows, rules, "AND")
-    assert len(result) == 0
-
-
-def test_or_either_true_keeps_row():
-    rows = [["alpha", 5], ["beta", 20], ["gamma", 1]]
-    rules = [
-        _rule("equals", "alpha", col="A"),
-        _rule(">", "10", col="B"),
-    ]
-    result = apply_rules(rows, rules, "OR")
-    assert len(result) == 2
-    values = [r[0] for r in result]
-    assert "alpha" in values and "beta" in values
-
-
-def test_or_neither_true_drops_row():
-    rows = [["gamma", 1]]
-    rules = [
-        _rule("equals", "alpha", col="A"),
-        _rule(">", "10", col="B"),
-    ]
-    result = apply_rules(rows, rules, "OR")
-    assert len(result) == 0
-
-
-def test_and_three_rules_all_must_pass():
-    rows = [
-        ["alpha", 20, "yes"],
-        ["alpha", 20, "no"],
-        ["beta",  20, "yes"],
-    ]
-    rules = [
-        _rule("equals",   "alpha", col="A"),
-        _rule(">",        "10",    col="B"),
-        _rule("equals",   "yes",   col="C"),
-    ]
-    result = apply_rules(rows, rules, "AND")
-    assert len(result) == 1
-    assert result[0] == ["alpha", 20, "yes"]
-
-
-# ══════════════════════════════════════════════════════════════════════════════
-# MIXED INCLUDE / EXCLUDE
-# ══════════════════════════════════════════════════════════════════════════════
-
-def test_mixed_include_and_exclude_and_mode():
-    """Include col A equals alpha AND exclude col B equals 20."""
-    rows = [
-        ["alpha", 10],
-        ["alpha", 20],
-        ["beta",  10],
-    ]
-    rules = [
-        _rule("equals", "alpha", col="A", mode="include"),
-        _rule("equals", "20",    col="B", mode="exclude"),
-    ]
-    result = apply_rules(rows, rules, "AND")
-    assert len(result) == 1
-    assert result[0] == ["alpha", 10]
-
-
-def test_all_exclude_or_keeps_rows_not_matching_any():
-    rows = [["alpha"], ["beta"], ["gamma"]]
-    rules = [
-        _rule("equals", "alpha", mode="exclude"),
-        _rule("equals", "beta",  mode="exclude"),
-    ]
-    result = apply_rules(rows, rules, "OR")
-    # OR with exclude: kept if ANY exclusion does NOT match
-    # gamma: exclude alpha → True (not alpha), exclude beta → True (not beta) → OR True → kept
-    # alpha: exclude alpha → False, exclude beta → True → OR True → kept
-    # beta:  exclude alpha → True, exclude beta → False → OR True → kept
-    assert len(result) == 3
-
-
-def test_all_exclude_and_drops_any_matching_row():
-    rows = [["alpha"], ["beta"], ["gamma"]]
-    rules = [
-        _rule("equals", "alpha", mode="exclude"),
-        _rule("equals", "beta",  mode="exclude"),
-    ]
-    result = apply_rules(rows, rules, "AND")
-    # AND with exclude: kept only if ALL exclusions True (no rule matched)
-    assert len(result) == 1
-    assert result[0][0] == "gamma"
+_ALPHA_AND_B_OVER_10 = [_rule("equals", "alpha", col="A"), _rule(">", "10", col="B")]
+_EXCLUDE_ALPHA_BETA = [_rule("equals", "alpha", mode="exclude"),
+                       _rule("equals", "beta", mode="exclude")]
+
+_MULTI_RULE_CASES = {
+    "and_both_true_keeps_row": ([["alpha", 20], ["beta", 5]], _ALPHA_AND_B_OVER_10, "AND",
+                                [["alpha", 20]]),
+    "and_one_false_drops_row": ([["alpha", 5], ["beta", 20]], _ALPHA_AND_B_OVER_10, "AND",
+                                []),
+    "or_either_true_keeps_row": ([["alpha", 5], ["beta", 20], ["gamma", 1]],
+                                 _ALPHA_AND_B_OVER_10, "OR",
+                                 [["alpha", 5], ["beta", 20]]),
+    "or_neither_true_drops_row": ([["gamma", 1]], _ALPHA_AND_B_OVER_10, "OR",
+                                  []),
+    "and_three_rules_all_must_pass": (
+        [["alpha", 20, "yes"], ["alpha", 20, "no"], ["beta", 20, "yes"]],
+        [_rule("equals", "alpha", col="A"), _rule(">", "10", col="B"),
+         _rule("equals", "yes", col="C")],
+        "AND",
+        [["alpha", 20, "yes"]]),
+    # Include col A equals alpha AND exclude col B equals 20
+    "mixed_include_exclude_and": (
+        [["alpha", 10], ["alpha", 20], ["beta", 10]],
+        [_rule("equals", "alpha", col="A", mode="include"),
+         _rule("equals", "20", col="B", mode="exclude")],
+        "AND",
+        [["alpha", 10]]),
+    # OR with exclude: kept if ANY exclusion does NOT match — every row here
+    "all_exclude_or_keeps_rows_not_matching_any": (
+        [["alpha"], ["beta"], ["gamma"]], _EXCLUDE_ALPHA_BETA, "OR",
+        [["alpha"], ["beta"], ["gamma"]]),
+    # AND with exclude: kept only if no rule matched
+    "all_exclude_and_drops_any_matching_row": (
+        [["alpha"], ["beta"], ["gamma"]], _EXCLUDE_ALPHA_BETA, "AND",
+        [["gamma"]]),
+}
+
+
+@pytest.mark.parametrize("rows,rules,combine,expected",
+                         list(_MULTI_RULE_CASES.values()), ids=list(_MULTI_RULE_CASES))
+def test_multiple_rules(rows, rules, combine, expected):
+    assert apply_rules(rows, rules, combine) == expected
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -379,3 +214,163 @@ def test_bad_combine_mode_raises_invalid_rule():
     with pytest.raises(AppError) as ei:
         apply_rules([["a"]], [_rule("equals", "a")], "XOR")
     assert ei.value.code == INVALID_RULE
+
+
+def test_bad_later_rule_raises_even_when_first_rule_decides_row():
+    """OR short-circuit must not hide an invalid rule further down the list."""
+    rules = [_rule("equals", "a"), _rule("LIKE", "x")]
+    with pytest.raises(AppError) as ei:
+        apply_rules([["a"]], rules, "OR")
+    assert ei.value.code == INVALID_RULE
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# COMPILED RULES
+# ══════════════════════════════════════════════════════════════════════════════
+
+_COMPILED_ROWS = [
+    ["alpha",  "10", "x"],
+    ["Beta",   "20", None],
+    ["gamma",  "5",  "x"],
+    [" beta ", "abc"],
+    ["",       None, None],
+]
+
+_RULE_TABLE = {
+    "contains": ([_rule("contains", "a")],
+                 {"AND": [0, 1, 2, 3], "OR": [0, 1, 2, 3]}),
+    "gt_and_exclude": ([_rule(">", "8", col="B"),
+                        _rule("equals", "x", col="C", mode="exclude")],
+                       {"AND": [1], "OR": [0, 1, 3, 4]}),
+    "equals_and_lt": ([_rule("equals", "beta"), _rule("<", "15", col="B")],
+                      {"AND": [], "OR": [0, 1, 2, 3]}),
+    "three_rules": ([_rule("contains", "a"), _rule(">", "1", col="B"),
+                     _rule("equals", "x", col="C")],
+                    {"AND": [0, 2], "OR": [0, 1, 2, 3]}),
+}
+
+
+@pytest.mark.parametrize("combine", ["AND", "OR"])
+@pytest.mark.parametrize("case", sorted(_RULE_TABLE))
+def test_compile_rules_matches_apply_rules(case, combine):
+    rules, expected = _RULE_TABLE[case]
+    keep = compile_rules(rules, combine)
+    compiled = [r for r in _COMPILED_ROWS if keep(r)]
+    assert compiled == apply_rules(_COMPILED_ROWS, rules, combine)
+    assert compiled == [_COMPILED_ROWS[i] for i in expected[combine]]
+
+
+def test_compile_rules_empty_keeps_every_row():
+    keep = compile_rules([], "AND")
+    assert all(keep(r) for r in _COMPILED_ROWS)
+
+
+def test_compile_rules_validates_eagerly():
+    with pytest.raises(AppError) as ei:
+        compile_rules([_rule("equals", "a"), _rule("LIKE", "x")], "OR")
+    assert ei.value.code == INVALID_RULE
+    with pytest.raises(AppError) as ei:
+        compile_rules([_rule("equals", "a")], "XOR")
+    assert ei.value.code == INVALID_RULE
+
+
+def test_text_memo_keeps_strings_and_other_types_apart():
+    """Repeated string cells hit the per-rule memo; 1 / 1.0 / True / "1" stay distinct."""
+    rows = [["1"], [1], [1.0], [True], [" 1.0 "], ["1"], ["true"], [None]]
+    assert _apply(rows, "equals", "1") == [["1"], [1], [1.0], [True], [" 1.0 "], ["1"]]
+    assert _apply(rows, "equals", "TRUE") == [[True], ["true"]]
+    assert _apply(rows, "contains", "1.") == [[1.0], [" 1.0 "]]
+
+
+def test_compile_rules_returns_own_predicate_per_call():
+    """Each caller owns its predicate (and its text memos); none is cached."""
+    rules = [_rule("contains", "a"), _rule(">", "8", col="B")]
+    first = compile_rules(rules, "AND")
+    assert compile_rules(rules, " and ") is not first
+    assert first is not rules_mod._combine(rules, "AND")
+
+
+def test_apply_rules_reuses_compiled_predicates_for_equal_rules():
+    rules = [_rule("contains", "reuse-a"), _rule(">", "8", col="B")]
+    apply_rules(_COMPILED_ROWS, rules, "AND")
+    hits = rules_mod._compile_key.cache_info().hits
+    apply_rules(_COMPILED_ROWS, [_rule("contains", "reuse-a"), _rule(">", "8", col="B")], "AND")
+    assert rules_mod._compile_key.cache_info().hits > hits
+
+    rules[0].value = "zzz"                       # edited rule → recompiled
+    assert apply_rules(_COMPILED_ROWS, rules, "AND") == []
+
+
+@pytest.mark.parametrize("n_rows", [len(_COMPILED_ROWS), 300], ids=["short", "reordered"])
+def test_apply_rules_clears_text_memos_after_each_call(monkeypatch, n_rows):
+    """Cached predicates keep no cell strings once apply_rules returns."""
+    rules = [_rule("contains", "a"), _rule("equals", "x", col="C")]
+    cleared = []
+    predicates = rules_mod._compile_key(rules_mod._rule_key(rules))
+    for p in predicates:
+        monkeypatch.setattr(p, "cache_clear", lambda p=p: cleared.append(p))
+    rows = (_COMPILED_ROWS * 60)[:n_rows]
+    apply_rules(rows, rules, "OR")
+    assert cleared == list(predicates)
+
+
+_COLUMNWISE_ROWS = _COMPILED_ROWS + [
+    ["delta", 7, True],
+    ["eps",   "1e1", "X"],
+    ["zeta",  " 30 ", "x"],
+    ["eta",   "nan", "x"],
+    ["theta"],
+]
+
+
+@pytest.mark.parametrize("combine", ["AND", "OR"])
+@pytest.mark.parametrize("rules", [
+    [_rule(">", "8", col="B")],
+    [_rule("<", "15", col="B", mode="exclude")],
+    [_rule(">", "abc", col="B")],
+    [_rule(">", "5", col="B"), _rule("<", "25", col="B")],
+    [_rule(">", "0.5", col="C"), _rule("contains", "ta")],
+    [_rule("<", "20", col="B"), _rule("equals", "x", col="C", mode="exclude")],
+    [_rule("contains", "ta"), _rule("contains", "E", mode="exclude")],
+    [_rule("equals", " BETA "), _rule("equals", "", col="A")],
+    [_rule("equals", "", col="C"), _rule("equals", "10", col="B"), _rule("equals", "x", col="C")],
+], ids=lambda rs: "+".join(f"{r.mode[:2]}:{r.column}{r.operator}{r.value}" for r in rs))
+def test_columnwise_rules_match_row_path(monkeypatch, rules, combine):
+    pytest.importorskip("numpy")
+    expected = [r for r in _COLUMNWISE_ROWS if compile_rules(rules, combine)(r)]
+    monkeypatch.setattr(rules_mod, "_VECTOR_MIN_ROWS", 0)
+    assert apply_rules(_COLUMNWISE_ROWS, rules, combine) == expected
+
+
+def test_columnwise_numeric_equals_uses_cached_predicate(monkeypatch):
+    """The numeric-equals fallback reuses (and clears) the cached row predicate."""
+    pytest.importorskip("numpy")
+    rules = [_rule(">", "5", col="B"), _rule("equals", "10", col="B")]
+    predicates = rules_mod._compile_key(rules_mod._rule_key(rules))
+    cleared = []
+    for p in predicates:
+        monkeypatch.setattr(p, "cache_clear", lambda p=p: cleared.append(p))
+    monkeypatch.setattr(rules_mod, "_compile_rule", None)    # any recompile fails
+    monkeypatch.setattr(rules_mod, "_VECTOR_MIN_ROWS", 0)
+    assert apply_rules(_COLUMNWISE_ROWS, rules, "AND") == [["alpha", "10", "x"], ["eps", "1e1", "X"]]
+    assert cleared == list(predicates)
+
+
+@pytest.mark.parametrize("combine", ["AND", "OR"])
+def test_selectivity_reorder_matches_row_path(monkeypatch, combine):
+    rules = [_rule("contains", "a"), _rule("equals", "x", col="C"),
+             _rule(">", "8", col="B", mode="exclude")]
+    expected = [r for r in _COLUMNWISE_ROWS if compile_rules(rules, combine)(r)]
+    monkeypatch.setattr(rules_mod, "_REORDER_MIN_ROWS", 0)
+    monkeypatch.setattr(rules_mod, "_SELECTIVITY_SAMPLE", 3)
+    kept = apply_rules(_COLUMNWISE_ROWS, rules, combine)
+    assert kept == expected
+    assert all(a is b for a, b in zip(kept, expected))
+
+
+def test_by_selectivity_puts_decisive_rule_first():
+    rare   = compile_rules([_rule("equals", "beta")], "AND")
+    common = compile_rules([_rule("contains", "a")], "AND")
+    sample = _COLUMNWISE_ROWS
+    assert rules_mod._by_selectivity([common, rare], sample, "AND") == [rare, common]
+    assert rules_mod._by_selectivity([rare, common], sample, "OR") == [common, rare]
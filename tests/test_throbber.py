@@ -12,69 +12,60 @@ from __future__ import annotations
 
 import pytest
 
-try:
-    import tkinter as tk
-    _root = tk.Tk()
-    tk.Frame(_root)
-    _root.destroy()
-    _TCL_OK = True
-except Exception:
-    _TCL_OK = False
+from gui.mixins.throbber_mixin import Throbber, ThrobberMixin
 
-pytestmark = pytest.mark.skipif(not _TCL_OK, reason="Tcl/Tk not available")
 
-from gui.mixins.throbber_mixin import Throbber, ThrobberMixin
+# Module-scoped fixtures: keep this file on one xdist worker (--dist=loadgroup)
+pytestmark = pytest.mark.xdist_group("throbber")
 
 
-def test_throbber_starts_with_idle_char():
-    root = tk.Tk()
-    t = Throbber(root)
-    assert t.running is False
-    # Idle state draws a small oval — canvas should have items
-    root.update_idletasks()
-    assert len(t.find_all()) > 0
+@pytest.fixture(scope="module")
+def _module_throbber(tk_root):
+    t = Throbber(tk_root)
+    yield t
     t.destroy()
-    root.destroy()
 
 
-def test_throbber_start_sets_running():
-    root = tk.Tk()
-    t = Throbber(root)
-    t.start()
-    assert t.running is True
-    root.update_idletasks()
+@pytest.fixture
+def throbber(_module_throbber):
+    """One Throbber canvas for the module, stopped (idle) around every test."""
+    _module_throbber.stop()
+    yield _module_throbber
+    _module_throbber.stop()
+
+
+def test_throbber_starts_with_idle_char(throbber):
+    assert throbber.running is False
+    # Idle state draws a small oval — canvas should have items
+    throbber.update_idletasks()
+    assert len(throbber.find_all()) > 0
+
+
+def test_throbber_start_sets_running(throbber):
+    throbber.start()
+    assert throbber.running is True
+    throbber.update_idletasks()
     # Spinning state draws background ring + arc = at least 2 items
-    assert len(t.find_all()) >= 2
-    t.stop()
-    t.destroy()
-    root.destroy()
+    assert len(throbber.find_all()) >= 2
 
 
-def test_throbber_stop_resets_to_idle():
-    root = tk.Tk()
-    t = Throbber(root)
-    t.start()
-    root.update_idletasks()
-    t.stop()
-    assert t.running is False
-    root.update_idletasks()
+def test_throbber_stop_resets_to_idle(throbber):
+    throbber.start()
+    throbber.update_idletasks()
+    throbber.stop()
+    assert throbber.running is False
+    assert throbber._after_id is None
+    throbber.update_idletasks()
     # Back to idle — single oval
-    assert len(t.find_all()) == 1
-    t.destroy()
-    root.destroy()
-
-
-def test_throbber_start_is_idempotent():
-    root = tk.Tk()
-    t = Throbber(root)
-    t.start()
-    first_after_id = t._after_id
-    t.start()  # second call should be a no-op
-    assert t._after_id == first_after_id
-    assert t.running is True
-    t.stop()
-    t.destroy()
-    root.destroy()
+    assert len(throbber.find_all()) == 1
+
+
+def test_throbber_start_is_idempotent(throbber):
+    throbber.start()
+    first_after_id = throbber._after_id
+    throbber.start()  # second call should be a no-op
+    assert throbber._after_id == first_after_id
+    assert throbber.running is True
 
 
 def test_throbber_mixin_start_stop_no_widget():
@@ -11,29 +11,19 @@ Tests:
 """
 from __future__ import annotations
 
-import pytest
-
-try:
-    import tkinter as tk
-    _root = tk.Tk()
-    tk.Frame(_root)
-    _root.destroy()
-    _TCL_OK = True
-except Exception:
-    _TCL_OK = False
-
-pytestmark = pytest.mark.skipif(not _TCL_OK, reason="Tcl/Tk not available")
+import tkinter as tk
 
+import gui.tooltip as tooltip
 from gui.tooltip import add_tooltip, _Tooltip
 
 
-def test_add_tooltip_attaches_without_error():
-    root = tk.Tk()
-    btn = tk.Button(root, text="Test")
+def test_add_tooltip_attaches_without_error(tk_root):
+    top = tk.Toplevel(tk_root)
+    btn = tk.Button(top, text="Test")
     btn.pack()
     add_tooltip(btn, "Hello tooltip")
-    root.update_idletasks()
-    root.destroy()
+    top.update_idletasks()
+    top.destroy()
 
 
 def test_tooltip_none_widget_no_crash():
@@ -41,61 +31,59 @@ def test_tooltip_none_widget_no_crash():
     add_tooltip(None, "some text")
 
 
-def test_tooltip_empty_text_no_crash():
+def test_tooltip_empty_text_no_crash(tk_root):
     """add_tooltip(widget, '') must not raise or attach."""
-    root = tk.Tk()
-    btn = tk.Button(root, text="Test")
+    top = tk.Toplevel(tk_root)
+    btn = tk.Button(top, text="Test")
     btn.pack()
     add_tooltip(btn, "")
-    root.update_idletasks()
-    root.destroy()
+    top.update_idletasks()
+    top.destroy()
 
 
-def test_tooltip_show_and_hide():
-    root = tk.Tk()
-    btn = tk.Button(root, text="Hover me")
+def test_tooltip_show_and_hide(tk_root, monkeypatch):
+    # Zero hover delay: the scheduled show fires on the next event-loop pass
+    # instead of the test sleeping out the real 400 ms.
+    monkeypatch.setattr(tooltip, "_DELAY_MS", 0)
+    top = tk.Toplevel(tk_root)
+    btn = tk.Button(top, text="Hover me")
     btn.pack()
-    root.update_idletasks()
+    top.update_idletasks()
 
     tip = _Tooltip(btn, "Test tip")
 
     # Simulate enter → schedule show
     tip._on_enter()
-    # Force the delayed show to fire
-    root.after(500, lambda: None)
-    root.update()
-    # Give it time to show
-    import time
-    time.sleep(0.5)
-    root.update()
+    assert tip._after_id is not None
+    top.update()
 
     assert tip._tip_window is not None
 
     # Simulate leave → hide
     tip._on_leave()
-    root.update_idletasks()
+    top.update_idletasks()
     assert tip._tip_window is None
 
-    root.destroy()
+    top.destroy()
 
 
-def test_multiple_tooltips_independent():
-    root = tk.Tk()
-    b1 = tk.Button(root, text="A")
-    b2 = tk.Button(root, text="B")
+def test_multiple_tooltips_independent(tk_root):
+    top = tk.Toplevel(tk_root)
+    b1 = tk.Button(top, text="A")
+    b2 = tk.Button(top, text="B")
     b1.pack()
     b2.pack()
     add_tooltip(b1, "Tip A")
     add_tooltip(b2, "Tip B")
-    root.update_idletasks()
-    root.destroy()
+    top.update_idletasks()
+    top.destroy()
 
 
-def test_tooltip_on_combobox():
-    root = tk.Tk()
+def test_tooltip_on_combobox(tk_root):
+    top = tk.Toplevel(tk_root)
     from tkinter import ttk
-    cb = ttk.Combobox(root, values=["X", "Y"], state="readonly")
+    cb = ttk.Combobox(top, values=["X", "Y"], state="readonly")
     cb.pack()
     add_tooltip(cb, "Combo tooltip")
-    root.update_idletasks()
-    root.destroy()
+    top.update_idletasks()
+    top.destroy()